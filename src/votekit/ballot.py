@@ -1,4 +1,5 @@
 from fractions import Fraction
+from numbers import Integral
 from pydantic.dataclasses import dataclass
 from pydantic import ConfigDict
 from dataclasses import field
@@ -33,9 +34,12 @@ class Ballot:
     def __post_init__(self):
         # converts weight to a Fraction if an integer or float
         if not isinstance(self.weight, Fraction):
-            object.__setattr__(
-                self, "weight", Fraction(self.weight).limit_denominator()
-            )
+            if isinstance(self.weight, Integral):
+                # integers are already exact, so skip the rational approximation
+                weight = Fraction(int(self.weight))
+            else:
+                weight = Fraction(self.weight).limit_denominator()
+            object.__setattr__(self, "weight", weight)
 
     def __eq__(self, other):
         # Check type
@@ -6,7 +6,6 @@ import math
 import numpy as np
 from pathlib import Path
 import pickle
-import random
 import warnings
 from typing import Optional, Union, Tuple
 import apportionment.methods as apportion  # type: ignore
@@ -20,6 +19,7 @@ def sample_cohesion_ballot_types(
     slate_to_non_zero_candidates: dict,
     num_ballots: int,
     cohesion_parameters_for_bloc: dict,
+    rng: Optional[np.random.Generator] = None,
 ):
     """
     Used to generate bloc orderings given cohesion parameters.
@@ -31,16 +31,21 @@ def sample_cohesion_ballot_types(
         cohesion_parameters_for_bloc (dict): A mapping of blocs to cohesion parameters.
                                 Note, this is equivalent to one value in the cohesion_parameters
                                 dictionary.
+        rng (np.random.Generator, optional): The random number generator to use. Defaults to
+                                a new, unseeded generator.
 
 
     Returns:
       A list of lists of length `num_ballots`, where each sublist contains the bloc names in order
       they appear on that ballot.
     """
+    if rng is None:
+        rng = np.random.default_rng()
+
     candidates = list(it.chain(*list(slate_to_non_zero_candidates.values())))
     ballots = [[-1]] * num_ballots
     # precompute coin flips
-    coin_flips = list(np.random.uniform(size=len(candidates) * num_ballots))
+    coin_flips = list(rng.uniform(size=len(candidates) * num_ballots))
 
     def which_bin(dist_bins, flip):
         for i, bin in enumerate(dist_bins):
@@ -79,6 +84,29 @@ def sample_cohesion_ballot_types(
     return ballots
 
 
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Finds the column indices of the `k` largest entries in each row of `scores`, in decreasing
+    order of score. Only the top `k` columns of each row are sorted.
+
+    Args:
+        scores (np.ndarray): A 2-D array of scores.
+        k (int): The number of indices to keep per row.
+
+    Returns:
+        np.ndarray: A 2-D integer array with `k` columns.
+    """
+    if k >= scores.shape[1]:
+        return np.argsort(-scores, axis=1)
+
+    if k <= 0:
+        return np.empty((scores.shape[0], 0), dtype=int)
+
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    return np.take_along_axis(top, np.argsort(-top_scores, axis=1), axis=1)
+
+
 class BallotGenerator:
     """
     Base class for ballot generation models that use the candidate simplex
@@ -100,6 +128,10 @@ class BallotGenerator:
     `bloc_voter_prop`
     :   dictionary mapping of bloc to voter proportions (ex. {bloc: voter proportion}).
 
+    `seed`
+    :   optional seed (or `np.random.Generator`) for the random number generator shared by
+        all of the sampling methods of the generator.
+
 
     ???+ note
         * Voter proportion for blocs must sum to 1.
@@ -113,6 +145,8 @@ class BallotGenerator:
         self,
         **kwargs,
     ):
+        self._rng = np.random.default_rng(kwargs.get("seed"))
+
         if "candidates" not in kwargs and "slate_to_candidates" not in kwargs:
             raise ValueError(
                 "At least one of candidates or slate_to_candidates must be provided."
@@ -123,9 +157,12 @@ class BallotGenerator:
 
         if "slate_to_candidates" in kwargs:
             self.slate_to_candidates = kwargs["slate_to_candidates"]
-            self.candidates = [
-                c for c_list in self.slate_to_candidates.values() for c in c_list
-            ]
+            # order preserving dedup, in case a candidate is listed in several slates
+            self.candidates = list(
+                dict.fromkeys(
+                    c for c_list in self.slate_to_candidates.values() for c in c_list
+                )
+            )
 
         nec_parameters = [
             "pref_intervals_by_bloc",
@@ -213,20 +250,55 @@ class BallotGenerator:
         if slate_to_candidates.keys() != bloc_voter_prop.keys():
             raise ValueError("Blocs are not the same")
 
-        pref_intervals_by_bloc = {}
-        for current_bloc in bloc_voter_prop:
-            intervals = {}
-            for b in bloc_voter_prop:
+        # share one generator between the intervals and the ballot generator so a
+        # seed makes the whole construction reproducible
+        rng = np.random.default_rng(data.get("seed"))
+        data["seed"] = rng
+
+        # draw every interval at once: normalizing independent Gamma(alpha) draws
+        # within a group of candidates gives a Dirichlet(alpha) sample for that group
+        groups = [
+            (current_bloc, b)
+            for current_bloc in bloc_voter_prop
+            for b in bloc_voter_prop
+        ]
+        group_sizes = [len(slate_to_candidates[b]) for _, b in groups]
+        group_starts = np.cumsum([0] + group_sizes[:-1])
+
+        gamma_draws = rng.standard_gamma(
+            np.repeat(
+                [alphas[current_bloc][b] for current_bloc, b in groups], group_sizes
+            )
+        )
+        group_sums = np.add.reduceat(gamma_draws, group_starts)
+
+        pref_intervals_by_bloc: dict = {
+            current_bloc: {} for current_bloc in bloc_voter_prop
+        }
+        for (current_bloc, b), start, size, total in zip(
+            groups, group_starts, group_sizes, group_sums
+        ):
+            # very small alphas can underflow every draw in a group to 0
+            if total == 0:
                 interval = PreferenceInterval.from_dirichlet(
-                    candidates=slate_to_candidates[b], alpha=alphas[current_bloc][b]
+                    candidates=slate_to_candidates[b],
+                    alpha=alphas[current_bloc][b],
+                    rng=rng,
+                )
+            else:
+                probs = gamma_draws[start : start + size] / total
+                interval = PreferenceInterval(
+                    dict(zip(slate_to_candidates[b], probs.tolist()))
                 )
-                intervals[b] = interval
 
-            pref_intervals_by_bloc[current_bloc] = intervals
+            pref_intervals_by_bloc[current_bloc][b] = interval
 
         if "candidates" not in data:
-            cands = [cand for cands in slate_to_candidates.values() for cand in cands]
-            data["candidates"] = cands
+            data["candidates"] = list(
+                dict.fromkeys(
+                    cand for cands in slate_to_candidates.values() for cand in cands
+                )
+            )
 
         data["pref_intervals_by_bloc"] = pref_intervals_by_bloc
         data["bloc_voter_prop"] = bloc_voter_prop
@@ -266,8 +338,7 @@ class BallotGenerator:
         """
         pass
 
-    @staticmethod
-    def _round_num(num: float) -> int:
+    def _round_num(self, num: float) -> int:
         """
         Rounds up or down a float randomly.
 
@@ -277,22 +348,163 @@ class BallotGenerator:
         Returns:
             int: A whole number.
         """
-        rand = np.random.random()
-        return math.ceil(num) if rand > 0.5 else math.floor(num)
+        return math.ceil(num) if self._rng.random() > 0.5 else math.floor(num)
+
+    def _ballots_per_bloc(self, number_of_ballots: int) -> dict:
+        """
+        Apportions `number_of_ballots` to the blocs by voter proportion with the
+        Huntington-Hill method, so the counts always sum to `number_of_ballots`.
+
+        Args:
+            number_of_ballots (int): The total number of ballots.
+
+        Returns:
+            dict: A mapping of bloc to its number of ballots.
+        """
+        return dict(
+            zip(
+                self.blocs,
+                apportion.compute(
+                    "huntington",
+                    [self.bloc_voter_prop[b] for b in self.blocs],
+                    number_of_ballots,
+                ),
+            )
+        )
+
+    def _ballots_per_voter_type(self, number_of_ballots: int) -> dict:
+        """
+        Apportions `number_of_ballots` in one Huntington-Hill pass to the voters of each bloc
+        who start with their own slate ("bloc") and those who cross over ("cross"), in
+        proportion to the bloc's voter proportion times its cohesion parameter (or one minus it).
+
+        Args:
+            number_of_ballots (int): The total number of ballots.
+
+        Returns:
+            dict: A mapping of (bloc, "bloc") and (bloc, "cross") to a number of ballots.
+        """
+        voter_types = [(b, t) for b in self.blocs for t in ["bloc", "cross"]]
+
+        voter_props = [
+            self.cohesion_parameters[b][b] * self.bloc_voter_prop[b]
+            if t == "bloc"
+            else (1 - self.cohesion_parameters[b][b]) * self.bloc_voter_prop[b]
+            for b, t in voter_types
+        ]
+
+        return dict(
+            zip(
+                voter_types,
+                apportion.compute("huntington", voter_props, number_of_ballots),
+            )
+        )
+
+    def _set_pref_interval_by_bloc(self):
+        """
+        Sets `pref_interval_by_bloc`, the single preference interval of each bloc, combining
+        a nested dictionary of intervals by the cohesion parameters if needed. Also stores
+        each interval as a float64 array aligned with `candidates`, with zero for candidates
+        without support, in `_pref_arr_by_bloc`.
+        """
+        # if dictionary of pref intervals
+        if isinstance(
+            list(self.pref_intervals_by_bloc.values())[0], PreferenceInterval
+        ):
+            self.pref_interval_by_bloc = self.pref_intervals_by_bloc
+
+        # if nested dictionary of pref intervals, combine by cohesion
+        else:
+            self.pref_interval_by_bloc = {
+                bloc: combine_preference_intervals(
+                    [self.pref_intervals_by_bloc[bloc][b] for b in self.blocs],
+                    [self.cohesion_parameters[bloc][b] for b in self.blocs],
+                )
+                for bloc in self.blocs
+            }
+
+        self._cand_to_idx = {c: i for i, c in enumerate(self.candidates)}
+        self._pref_arr_by_bloc = {
+            bloc: np.array(
+                [interval.interval.get(c, 0.0) for c in self.candidates],
+                dtype=np.float64,
+            )
+            for bloc, interval in self.pref_interval_by_bloc.items()
+        }
+
+    def _slate_pref_vectors(self) -> dict:
+        """
+        Restricts each bloc's preference interval for each slate to the candidates with
+        non-zero support.
+
+        Returns:
+            dict: A mapping of (bloc, slate) to a tuple (candidates, probabilities), where
+                `probabilities` is a numpy array aligned with the list `candidates`.
+        """
+        return {
+            (bloc, slate): (
+                list(interval.interval.keys()),
+                np.array(list(interval.interval.values()), dtype=np.float64),
+            )
+            for bloc, intervals in self.pref_intervals_by_bloc.items()
+            for slate, interval in intervals.items()
+        }
 
     @staticmethod
-    def ballot_pool_to_profile(ballot_pool, candidates) -> PreferenceProfile:
+    def ballot_pool_to_profile(
+        ballot_pool, candidates, num_tied: int = 0
+    ) -> PreferenceProfile:
         """
         Given a list of ballots and candidates, convert them into a `PreferenceProfile.`
 
         Args:
-            ballot_pool (list of tuple): A list of ballots, where each ballot is a tuple
-                    of candidates indicating their ranking from top to bottom.
+            ballot_pool (list of tuple or np.ndarray): A list of ballots, where each ballot is a
+                    tuple of candidates indicating their ranking from top to bottom. Can also be
+                    a 2-D integer array whose rows are ballots given as indices into `candidates`.
             candidates (list): A list of candidates.
+            num_tied (int, optional): Only used when `ballot_pool` is an array. The last
+                    `num_tied` entries of each row are ranked as a tie in the final position.
+                    Defaults to 0.
+
+        ???+ note
+            Negative entries of an array `ballot_pool` are treated as padding and skipped, so
+            ballots of different lengths can share one array.
 
         Returns:
             (PreferenceProfile): A PreferenceProfile representing the ballots in the election.
         """
+        if isinstance(ballot_pool, np.ndarray):
+            if num_tied:
+                # tied candidates are unordered, so sort them to count equal ties together
+                ballot_pool = np.concatenate(
+                    [
+                        ballot_pool[:, :-num_tied],
+                        np.sort(ballot_pool[:, -num_tied:], axis=1),
+                    ],
+                    axis=1,
+                )
+
+            rankings, counts = np.unique(ballot_pool, axis=0, return_counts=True)
+            num_ranked = rankings.shape[1] - num_tied
+
+            # the tied candidates, if any, share the final position
+            pool_ballots: list[Ballot] = [
+                Ballot(
+                    ranking=tuple(
+                        [frozenset({candidates[j]}) for j in row[:num_ranked] if j >= 0]
+                        + (
+                            [frozenset(candidates[j] for j in row[num_ranked:])]
+                            if num_tied
+                            else []
+                        )
+                    ),
+                    weight=Fraction(int(count)),
+                )
+                for row, count in zip(rankings, counts)
+            ]
+
+            return PreferenceProfile(ballots=pool_ballots, candidates=candidates)
+
         ranking_counts: dict[tuple, int] = {}
         ballot_list: list[Ballot] = []
 
@@ -385,35 +597,66 @@ class BallotSimplex(BallotGenerator):
         """
         Generates a PreferenceProfile from the ballot simplex.
         """
+        rng = self._rng
+        num_cands = len(self.candidates)
 
-        perm_set = it.permutations(self.candidates, len(self.candidates))
-
-        perm_rankings = [list(value) for value in perm_set]
+        def uniform_rankings(num_rankings):
+            # Fisher-Yates shuffle of every row, without listing all n! rankings
+            return rng.permuted(
+                np.tile(np.arange(num_cands), (num_rankings, 1)), axis=1
+            )
 
-        if self.alpha is not None:
-            draw_probabilities = list(
-                np.random.default_rng().dirichlet([self.alpha] * len(perm_rankings))
+        # an infinite alpha is uniform on all linear rankings
+        if self.alpha is not None and self.alpha >= 1e20:
+            ballot_pool = uniform_rankings(number_of_ballots)
+
+        # a draw from the Dirichlet(alpha) distribution on rankings followed by sampling
+        # from it is a Polya urn: ballot i is a fresh uniform ranking with probability
+        # a / (a + i) where a = alpha * n!, otherwise it copies an earlier ballot
+        elif self.alpha is not None and num_cands > 7:
+            total_alpha = self.alpha * math.factorial(num_cands)
+            steps = np.arange(number_of_ballots)
+            is_new = rng.random(number_of_ballots) < 1 / (1 + steps / total_alpha)
+            source = np.where(
+                is_new, steps, (rng.random(number_of_ballots) * steps).astype(int)
             )
 
-        elif self.point:
-            # calculates probabilities for each ranking
-            # using probability distribution for candidate support
-            draw_probabilities = [
-                reduce(
-                    lambda prod, cand: prod * self.point[cand] if self.point else 0,
-                    ranking,
-                    1.0,
+            # follow each copy back to the fresh ranking it came from
+            while not np.array_equal(source[source], source):
+                source = source[source]
+
+            ballot_pool = uniform_rankings(number_of_ballots)[source]
+
+        else:
+            perm_set = it.permutations(self.candidates, len(self.candidates))
+
+            perm_rankings = [list(value) for value in perm_set]
+            perm_indices = np.array(list(it.permutations(range(num_cands), num_cands)))
+
+            if self.alpha is not None:
+                draw_probabilities = list(
+                    rng.dirichlet([self.alpha] * len(perm_rankings))
                 )
-                for ranking in perm_rankings
-            ]
-            draw_probabilities = [
-                prob / sum(draw_probabilities) for prob in draw_probabilities
-            ]
 
-        indices = np.random.choice(
-            a=len(perm_rankings), size=number_of_ballots, p=draw_probabilities
-        )
-        ballot_pool = [perm_rankings[indices[i]] for i in range(number_of_ballots)]
+            elif self.point:
+                # calculates probabilities for each ranking
+                # using probability distribution for candidate support
+                draw_probabilities = [
+                    reduce(
+                        lambda prod, cand: prod * self.point[cand] if self.point else 0,
+                        ranking,
+                        1.0,
+                    )
+                    for ranking in perm_rankings
+                ]
+                draw_probabilities = [
+                    prob / sum(draw_probabilities) for prob in draw_probabilities
+                ]
+
+            indices = rng.choice(
+                a=len(perm_rankings), size=number_of_ballots, p=draw_probabilities
+            )
+            ballot_pool = perm_indices[indices]
 
         return self.ballot_pool_to_profile(ballot_pool, self.candidates)
 
@@ -520,21 +763,7 @@ class short_name_PlackettLuce(BallotGenerator):
         super().__init__(**data)
         self.ballot_length = ballot_length
 
-        # if dictionary of pref intervals
-        if isinstance(
-            list(self.pref_intervals_by_bloc.values())[0], PreferenceInterval
-        ):
-            self.pref_interval_by_bloc = self.pref_intervals_by_bloc
-
-        # if nested dictionary of pref intervals, combine by cohesion
-        else:
-            self.pref_interval_by_bloc = {
-                bloc: combine_preference_intervals(
-                    [self.pref_intervals_by_bloc[bloc][b] for b in self.blocs],
-                    [self.cohesion_parameters[bloc][b] for b in self.blocs],
-                )
-                for bloc in self.blocs
-            }
+        self._set_pref_interval_by_bloc()
 
     def generate_profile(
         self, number_of_ballots: int, by_bloc: bool = False
@@ -547,13 +776,7 @@ class short_name_PlackettLuce(BallotGenerator):
                     False if you want the full, aggregated PreferenceProfile.
         """
         # the number of ballots per bloc is determined by Huntington-Hill apportionment
-        bloc_props = list(self.bloc_voter_prop.values())
-        ballots_per_block = dict(
-            zip(
-                self.blocs,
-                apportion.compute("huntington", bloc_props, number_of_ballots),
-            )
-        )
+        ballots_per_block = self._ballots_per_bloc(number_of_ballots)
 
         # dictionary to store preference profiles by bloc
         pp_by_bloc = {b: PreferenceProfile() for b in self.blocs}
@@ -561,12 +784,15 @@ class short_name_PlackettLuce(BallotGenerator):
         for bloc in self.blocs:
             # number of voters in this bloc
             num_ballots = ballots_per_block[bloc]
-            ballot_pool = [Ballot()] * num_ballots
-            non_zero_cands = list(self.pref_interval_by_bloc[bloc].non_zero_cands)
-            pref_interval_values = [
-                self.pref_interval_by_bloc[bloc].interval[c] for c in non_zero_cands
-            ]
-            zero_cands = list(self.pref_interval_by_bloc[bloc].zero_cands)
+            pref_arr = self._pref_arr_by_bloc[bloc]
+            non_zero_cands = np.flatnonzero(pref_arr)
+            zero_cands = np.array(
+                [
+                    self._cand_to_idx[c]
+                    for c in self.pref_interval_by_bloc[bloc].zero_cands
+                ],
+                dtype=int,
+            )
 
             # if there aren't enough non-zero supported candidates,
             # include 0 support as ties
@@ -577,36 +803,25 @@ class short_name_PlackettLuce(BallotGenerator):
                 number_tied = number_to_sample - len(non_zero_cands)
                 number_to_sample = len(non_zero_cands)
 
-            for i in range(num_ballots):
-                # generates ranking based on probability distribution of non candidate support
-                # samples ballot_length candidates
-                non_zero_ranking = list(
-                    np.random.choice(
-                        non_zero_cands,
-                        number_to_sample,
-                        p=pref_interval_values,
-                        replace=False,
-                    )
-                )
-
-                ranking = [frozenset({cand}) for cand in non_zero_ranking]
-
-                if number_tied:
-                    tied_candidates = list(
-                        np.random.choice(
-                            zero_cands,
-                            number_tied,
-                            replace=False,
-                        )
-                    )
-                    ranking.append(frozenset(tied_candidates))
+            # sample every ranking at once with the Gumbel-top-k trick, which is
+            # equivalent to sampling without replacement from the preference interval
+            rng = self._rng
+            scores = np.log(pref_arr[non_zero_cands]) + rng.gumbel(
+                size=(num_ballots, len(non_zero_cands))
+            )
+            order = non_zero_cands[_top_k_indices(scores, number_to_sample)]
 
-                ballot_pool[i] = Ballot(ranking=tuple(ranking), weight=Fraction(1, 1))
+            if number_tied:
+                # uniformly random subset of the zero support candidates
+                tied_order = np.argsort(
+                    rng.random(size=(num_ballots, len(zero_cands))), axis=1
+                )[:, :number_tied]
+                order = np.concatenate([order, zero_cands[tied_order]], axis=1)
 
             # create PP for this bloc
-            pp = PreferenceProfile(ballots=ballot_pool)
-            pp = pp.condense_ballots()
-            pp_by_bloc[bloc] = pp
+            pp_by_bloc[bloc] = self.ballot_pool_to_profile(
+                order, self.candidates, num_tied=number_tied or 0
+            )
 
         # combine the profiles
         pp = PreferenceProfile(ballots=[])
@@ -697,27 +912,18 @@ class name_BradleyTerry(BallotGenerator):
         # Call the parent class's __init__ method to handle common parameters
         super().__init__(cohesion_parameters=cohesion_parameters, **data)
 
-        # if dictionary of pref intervals
-        if isinstance(
-            list(self.pref_intervals_by_bloc.values())[0], PreferenceInterval
-        ):
-            self.pref_interval_by_bloc = self.pref_intervals_by_bloc
+        self._set_pref_interval_by_bloc()
 
-        # if nested dictionary of pref intervals, combine by cohesion
-        else:
-            self.pref_interval_by_bloc = {
-                bloc: combine_preference_intervals(
-                    [self.pref_intervals_by_bloc[bloc][b] for b in self.blocs],
-                    [self.cohesion_parameters[bloc][b] for b in self.blocs],
-                )
-                for bloc in self.blocs
-            }
+        # permutation index matrices, shared by every bloc with the same number
+        # of non-zero candidates
+        self._perms_by_length: dict = {}
+        self._pdfs_by_bloc: Optional[dict] = None
 
         if len(self.candidates) < 12:
             # precompute pdfs for sampling
-            self.pdfs_by_bloc = {
-                bloc: self._BT_pdf(self.pref_interval_by_bloc[bloc].interval)
-                for bloc in self.blocs
+            self._probs_by_bloc = {
+                bloc: self._BT_probs(pref_arr[pref_arr > 0])
+                for bloc, pref_arr in self._pref_arr_by_bloc.items()
             }
         else:
             warnings.warn(
@@ -738,99 +944,121 @@ class name_BradleyTerry(BallotGenerator):
         Returns:
             dict: a mapping of the rankings to their probability
         """
-        ranking_to_prob = {}
+        cand_to_index = {c: i for i, c in enumerate(cand_support_dict)}
+        support = np.array(list(cand_support_dict.values()), dtype=np.float64)
+
+        # rankings of equal length are scored together as rows of an index matrix
+        rankings_by_length: dict[int, list[tuple]] = {}
         for ranking in permutations:
-            prob = 1
-            for i in range(len(ranking)):
-                cand_i = ranking[i]
-                greater_cand_support = cand_support_dict[cand_i]
-                for j in range(i + 1, len(ranking)):
-                    cand_j = ranking[j]
-                    cand_support = cand_support_dict[cand_j]
-                    prob *= greater_cand_support / (greater_cand_support + cand_support)
-            ranking_to_prob[ranking] = prob
+            rankings_by_length.setdefault(len(ranking), []).append(ranking)
+
+        ranking_to_prob: dict[tuple, float] = {}
+        for length, rankings in rankings_by_length.items():
+            perms = np.array(
+                [[cand_to_index[c] for c in ranking] for ranking in rankings],
+                dtype=np.int32,
+            ).reshape(len(rankings), length)
+            ranking_support = support[perms]
+
+            probs = np.ones(len(rankings))
+            for i in range(length):
+                greater_cand_support = ranking_support[:, i]
+                for j in range(i + 1, length):
+                    cand_support = ranking_support[:, j]
+                    probs *= greater_cand_support / (
+                        greater_cand_support + cand_support
+                    )
+
+            ranking_to_prob.update(zip(rankings, probs.tolist()))
         return ranking_to_prob
 
-    def _make_pow(self, lst):
-        """
-        Helper method for _BT_pdf.
-        Takes is a list representing the preference lengths of each candidate
-        in a permutation.
-        Computes the numerator of BT probability.
+    def _permutations(self, m: int) -> np.ndarray:
         """
-        ret = 1
-        m = len(lst)
-        for i, val in enumerate(lst):
-            if i < m - 1:
-                ret *= val ** (m - i - 1)
-        return ret
-
-    def _BT_pdf(self, dct):
+        Return every permutation of `range(m)` as the rows of an int32 matrix, in
+        `itertools.permutations` order. The matrix is computed once per length.
         """
-        Construct the BT pdf as a dictionary (ballot, probability) given a preference
-        interval as a dictionary (candidate, preference).
+        if m not in self._perms_by_length:
+            self._perms_by_length[m] = np.array(
+                list(it.permutations(range(m), m)), dtype=np.int32
+            ).reshape(-1, m)
+
+        return self._perms_by_length[m]
+
+    def _BT_probs(self, support: np.ndarray) -> np.ndarray:
+        r"""
+        Compute the BT probability of every ranking of the candidates with the given
+        non-zero `support`. Entry $j$ is the probability of row $j$ of
+        `_permutations(len(support))`, whose entries index into `support`.
+
+        The denominators $x+y$ of the pairwise probabilities do not depend on the order
+        of the candidates, so the probability of a ranking is proportional to
+        $\prod_i x_i^{m-i-1}$. This is computed in log space for every permutation at once.
         """
+        m = len(support)
+        perms = self._permutations(m)
 
-        # gives PI lengths for each candidate in permutation
-        def pull_perm(lst):
-            nonlocal dct
-            return [dct[i] for i in lst]
+        log_support = np.log(support)
+        log_weights = log_support[perms] @ np.arange(m - 1, -1, -1)
 
-        new_dct = {
-            perm: self._make_pow(pull_perm(perm))
-            for perm in it.permutations(dct.keys(), len(dct))
-        }
-        summ = sum(new_dct.values())
-        return {key: value / summ for key, value in new_dct.items()}
+        # shift by the max before exponentiating to avoid underflow
+        weights = np.exp(log_weights - log_weights.max())
+        return weights / weights.sum()
+
+    @property
+    def pdfs_by_bloc(self) -> dict:
+        """
+        The BT pdf of each bloc as a dictionary (ballot, probability), built on first
+        access from the probabilities used for sampling.
+        """
+        if self._pdfs_by_bloc is None:
+            self._pdfs_by_bloc = {}
+            for bloc, probs in self._probs_by_bloc.items():
+                cands = [
+                    self.candidates[i]
+                    for i in np.flatnonzero(self._pref_arr_by_bloc[bloc])
+                ]
+                perms = self._permutations(len(cands))
+                self._pdfs_by_bloc[bloc] = {
+                    tuple(cands[i] for i in perm): prob
+                    for perm, prob in zip(perms.tolist(), probs.tolist())
+                }
+
+        return self._pdfs_by_bloc
 
     def generate_profile(
         self, number_of_ballots, by_bloc: bool = False
     ) -> Union[PreferenceProfile, Tuple]:
         # the number of ballots per bloc is determined by Huntington-Hill apportionment
-
-        bloc_props = list(self.bloc_voter_prop.values())
-        ballots_per_block = dict(
-            zip(
-                self.blocs,
-                apportion.compute("huntington", bloc_props, number_of_ballots),
-            )
-        )
+        ballots_per_block = self._ballots_per_bloc(number_of_ballots)
 
         pp_by_bloc = {b: PreferenceProfile() for b in self.blocs}
 
         for bloc in self.blocs:
             num_ballots = ballots_per_block[bloc]
+            non_zero_cands = np.flatnonzero(self._pref_arr_by_bloc[bloc])
+            zero_cands = [
+                self._cand_to_idx[c]
+                for c in self.pref_interval_by_bloc[bloc].zero_cands
+            ]
+            perms = self._permutations(len(non_zero_cands))
 
-            # Directly initialize the list using good memory trick
-            ballot_pool = [Ballot()] * num_ballots
-            zero_cands = self.pref_interval_by_bloc[bloc].zero_cands
-            pdf_dict = self.pdfs_by_bloc[bloc]
-
-            # Directly use the keys and values from the dictionary for sampling
-            rankings, probs = zip(*pdf_dict.items())
-
-            # The return of this will be a numpy array, so we don't need to make it into a list
-            sampled_indices = np.array(
-                np.random.choice(
-                    a=len(rankings),
-                    size=num_ballots,
-                    p=probs,
-                ),
-                ndmin=1,
+            sampled_indices = self._rng.choice(
+                a=len(perms),
+                size=num_ballots,
+                p=self._probs_by_bloc[bloc],
             )
 
-            for j, index in enumerate(sampled_indices):
-                ranking = [frozenset({cand}) for cand in rankings[index]]
+            ballot_pool = non_zero_cands[perms[sampled_indices]]
 
-                # Add any zero candidates as ties only if they exist
-                if zero_cands:
-                    ranking.append(frozenset(zero_cands))
-
-                ballot_pool[j] = Ballot(ranking=tuple(ranking), weight=Fraction(1, 1))
+            # Add any zero candidates as ties only if they exist
+            if zero_cands:
+                ballot_pool = np.concatenate(
+                    [ballot_pool, np.tile(zero_cands, (num_ballots, 1))], axis=1
+                )
 
-            pp = PreferenceProfile(ballots=ballot_pool)
-            pp = pp.condense_ballots()
-            pp_by_bloc[bloc] = pp
+            pp_by_bloc[bloc] = self.ballot_pool_to_profile(
+                ballot_pool, self.candidates, num_tied=len(zero_cands)
+            )
 
         # combine the profiles
         pp = PreferenceProfile(ballots=[])
@@ -870,7 +1098,7 @@ class name_BradleyTerry(BallotGenerator):
         # presample swap indices
         swap_indices = [
             (j1, j1 + 1)
-            for j1 in random.choices(range(num_candidates - 1), k=num_ballots)
+            for j1 in self._rng.integers(num_candidates - 1, size=num_ballots)
         ]
 
         # generate MCMC sample
@@ -884,7 +1112,7 @@ class name_BradleyTerry(BallotGenerator):
             )
 
             # if you accept, make the swap
-            if random.random() < acceptance_prob:
+            if self._rng.random() < acceptance_prob:
                 current_ranking[j1], current_ranking[j2] = (
                     current_ranking[j2],
                     current_ranking[j1],
@@ -929,13 +1157,7 @@ class name_BradleyTerry(BallotGenerator):
         """
 
         # the number of ballots per bloc is determined by Huntington-Hill apportionment
-        bloc_props = list(self.bloc_voter_prop.values())
-        ballots_per_block = dict(
-            zip(
-                self.blocs,
-                apportion.compute("huntington", bloc_props, number_of_ballots),
-            )
-        )
+        ballots_per_block = self._ballots_per_bloc(number_of_ballots)
 
         pp_by_bloc = {b: PreferenceProfile() for b in self.blocs}
 
@@ -1016,81 +1238,59 @@ class AlternatingCrossover(BallotGenerator):
         self, number_of_ballots: int, by_bloc: bool = False
     ) -> Union[PreferenceProfile, Tuple]:
         # compute the number of bloc and crossover voters in each bloc using Huntington Hill
-        cohesion_parameters = {
-            b: self.cohesion_parameters[b][b] for b in self.cohesion_parameters
-        }
-
-        voter_types = [(b, type) for b in self.blocs for type in ["bloc", "cross"]]
-
-        voter_props = [
-            cohesion_parameters[b] * self.bloc_voter_prop[b]
-            if t == "bloc"
-            else (1 - cohesion_parameters[b]) * self.bloc_voter_prop[b]
-            for b, t in voter_types
-        ]
-
-        ballots_per_type = dict(
-            zip(
-                voter_types,
-                apportion.compute("huntington", voter_props, number_of_ballots),
-            )
-        )
+        ballots_per_type = self._ballots_per_voter_type(number_of_ballots)
 
         pp_by_bloc = {b: PreferenceProfile() for b in self.blocs}
 
+        rng = self._rng
+        slate_prefs = self._slate_pref_vectors()
+
         for i, bloc in enumerate(self.blocs):
-            ballot_pool = []
             num_bloc_ballots = ballots_per_type[(bloc, "bloc")]
             num_cross_ballots = ballots_per_type[(bloc, "cross")]
-
-            pref_interval_dict = self.pref_intervals_by_bloc[bloc]
+            num_ballots = num_cross_ballots + num_bloc_ballots
 
             opposing_slate = self.blocs[(i + 1) % 2]
 
-            opposing_cands = list(pref_interval_dict[opposing_slate].interval.keys())
-            bloc_cands = list(pref_interval_dict[bloc].interval.keys())
+            opposing_cands, pref_for_opposing = slate_prefs[(bloc, opposing_slate)]
+            bloc_cands, pref_for_bloc = slate_prefs[(bloc, bloc)]
+            cands = bloc_cands + opposing_cands
 
-            pref_for_opposing = list(
-                pref_interval_dict[opposing_slate].interval.values()
+            # draw every ordering of each slate at once with the Gumbel-top-k trick,
+            # indexing the opposing candidates after the bloc candidates
+            bloc_scores = np.log(pref_for_bloc) + rng.gumbel(
+                size=(num_ballots, len(bloc_cands))
+            )
+            opposing_scores = np.log(pref_for_opposing) + rng.gumbel(
+                size=(num_ballots, len(opposing_cands))
             )
-            pref_for_bloc = list(pref_interval_dict[bloc].interval.values())
-
-            for i in range(num_cross_ballots + num_bloc_ballots):
-                bloc_cands = list(
-                    np.random.choice(
-                        bloc_cands,
-                        p=pref_for_bloc,
-                        size=len(bloc_cands),
-                        replace=False,
-                    )
-                )
-                opposing_cands = list(
-                    np.random.choice(
-                        opposing_cands,
-                        p=pref_for_opposing,
-                        size=len(opposing_cands),
-                        replace=False,
-                    )
-                )
 
-                if i < num_cross_ballots:
-                    # alternate the bloc and opposing bloc candidates to create crossover ballots
-                    ranking = [
-                        frozenset({cand})
-                        for pair in zip(opposing_cands, bloc_cands)
-                        for cand in pair
-                    ]
-                else:
-                    ranking = [frozenset({c}) for c in bloc_cands] + [
-                        frozenset({c}) for c in opposing_cands
-                    ]
-
-                ballot = Ballot(ranking=tuple(ranking), weight=Fraction(1, 1))
-                ballot_pool.append(ballot)
+            # alternate the bloc and opposing bloc candidates to create crossover ballots,
+            # padding with -1 since they stop when either slate runs out, so only the
+            # top num_pairs of each slate are needed
+            num_pairs = min(len(bloc_cands), len(opposing_cands))
+            cross_bloc = _top_k_indices(bloc_scores[:num_cross_ballots], num_pairs)
+            cross_opposing = _top_k_indices(
+                opposing_scores[:num_cross_ballots], num_pairs
+            )
 
-            pp = PreferenceProfile(ballots=ballot_pool)
-            pp = pp.condense_ballots()
-            pp_by_bloc[bloc] = pp
+            ballot_pool = np.full((num_ballots, len(cands)), -1)
+            ballot_pool[:num_cross_ballots, 0 : 2 * num_pairs : 2] = (
+                len(bloc_cands) + cross_opposing
+            )
+            ballot_pool[:num_cross_ballots, 1 : 2 * num_pairs : 2] = cross_bloc
+
+            # bloc ballots rank the whole bloc slate above the opposing slate
+            ballot_pool[num_cross_ballots:] = np.concatenate(
+                [
+                    np.argsort(-bloc_scores[num_cross_ballots:], axis=1),
+                    len(bloc_cands)
+                    + np.argsort(-opposing_scores[num_cross_ballots:], axis=1),
+                ],
+                axis=1,
+            )
+
+            pp_by_bloc[bloc] = self.ballot_pool_to_profile(ballot_pool, cands)
 
         # combine the profiles
         pp = PreferenceProfile(ballots=[])
@@ -1125,17 +1325,12 @@ class OneDimSpatial(BallotGenerator):
     def generate_profile(
         self, number_of_ballots: int, by_bloc: bool = False
     ) -> Union[PreferenceProfile, Tuple]:
-        candidate_position_dict = {c: np.random.normal(0, 1) for c in self.candidates}
-        voter_positions = np.random.normal(0, 1, number_of_ballots)
+        candidate_positions = self._rng.normal(0, 1, len(self.candidates))
+        voter_positions = self._rng.normal(0, 1, number_of_ballots)
 
-        ballot_pool = []
-
-        for vp in voter_positions:
-            distance_dict = {
-                c: abs(v - vp) for c, v, in candidate_position_dict.items()
-            }
-            candidate_order = sorted(distance_dict, key=distance_dict.__getitem__)
-            ballot_pool.append(candidate_order)
+        # distance from every voter (row) to every candidate (column)
+        distances = np.abs(voter_positions[:, None] - candidate_positions[None, :])
+        ballot_pool = np.argsort(distances, axis=1, kind="stable")
 
         return self.ballot_pool_to_profile(ballot_pool, self.candidates)
 
@@ -1225,134 +1420,141 @@ class CambridgeSampler(BallotGenerator):
             DATA_DIR = BASE_DIR / "data/"
             self.path = Path(DATA_DIR, "Cambridge_09to17_ballot_types.p")
 
-    def generate_profile(
-        self, number_of_ballots: int, by_bloc: bool = False
-    ) -> Union[PreferenceProfile, Tuple]:
         with open(self.path, "rb") as pickle_file:
             ballot_frequencies = pickle.load(pickle_file)
 
+        # store the historical ballot types once as parallel arrays; each ballot type is a
+        # row of historical bloc codes padded with -1, with its frequency in _cam_freqs
+        self._cam_codes = {
+            b: code
+            for code, b in enumerate(
+                dict.fromkeys(b for ballot in ballot_frequencies for b in ballot)
+            )
+        }
+        max_length = max((len(ballot) for ballot in ballot_frequencies), default=0)
+        self._cam_ballots = np.full(
+            (len(ballot_frequencies), max_length), -1, dtype=np.int8
+        )
+        for j, ballot in enumerate(ballot_frequencies):
+            self._cam_ballots[j, : len(ballot)] = [self._cam_codes[b] for b in ballot]
+        self._cam_freqs = np.array(list(ballot_frequencies.values()), dtype=np.float64)
+
+        # for each historical first choice, the ballot types starting with it and their
+        # cumulative frequencies, so types can be sampled with a single searchsorted
+        first_codes = self._cam_ballots[:, 0]
+        self._cam_types_by_first = {
+            code: (
+                np.flatnonzero(first_codes == code),
+                np.cumsum(self._cam_freqs[first_codes == code]),
+            )
+            for code in self._cam_codes.values()
+        }
+
+    def generate_profile(
+        self, number_of_ballots: int, by_bloc: bool = False
+    ) -> Union[PreferenceProfile, Tuple]:
+        rng = self._rng
         cohesion_parameters = {b: self.cohesion_parameters[b][b] for b in self.blocs}
 
         # compute the number of bloc and crossover voters in each bloc using Huntington Hill
-        voter_types = [
-            (b, t) for b in list(self.bloc_voter_prop.keys()) for t in ["bloc", "cross"]
-        ]
-
-        voter_props = [
-            cohesion_parameters[b] * self.bloc_voter_prop[b]
-            if t == "bloc"
-            else (1 - cohesion_parameters[b]) * self.bloc_voter_prop[b]
-            for b, t in voter_types
-        ]
-
-        ballots_per_type = dict(
-            zip(
-                voter_types,
-                apportion.compute("huntington", voter_props, number_of_ballots),
-            )
-        )
+        ballots_per_type = self._ballots_per_voter_type(number_of_ballots)
 
         pp_by_bloc = {b: PreferenceProfile() for b in self.blocs}
 
         for i, bloc in enumerate(self.blocs):
             bloc_voters = ballots_per_type[(bloc, "bloc")]
             cross_voters = ballots_per_type[(bloc, "cross")]
-            ballot_pool = [Ballot()] * (bloc_voters + cross_voters)
 
             # store the opposition bloc
             opp_bloc = self.blocs[(i + 1) % 2]
 
-            # find total number of ballots that start with bloc and opp_bloc
-            bloc_first_count = sum(
-                [
-                    freq
-                    for ballot, freq in ballot_frequencies.items()
-                    if ballot[0] == self.bloc_to_historical[bloc]
-                ]
-            )
-
-            opp_bloc_first_count = sum(
-                [
-                    freq
-                    for ballot, freq in ballot_frequencies.items()
-                    if ballot[0] == self.bloc_to_historical[opp_bloc]
-                ]
-            )
-
             # Compute the pref interval for this bloc
             pref_interval_dict = combine_preference_intervals(
                 list(self.pref_intervals_by_bloc[bloc].values()),
                 [cohesion_parameters[bloc], 1 - cohesion_parameters[bloc]],
             )
 
-            # compute the relative probabilities of each ballot
-            # sorted by ones where the ballot lists the bloc first
-            # and those that list the opp first
-            prob_ballot_given_bloc_first = {
-                ballot: freq / bloc_first_count
-                for ballot, freq in ballot_frequencies.items()
-                if ballot[0] == self.bloc_to_historical[bloc]
-            }
-
-            prob_ballot_given_opp_first = {
-                ballot: freq / opp_bloc_first_count
-                for ballot, freq in ballot_frequencies.items()
-                if ballot[0] == self.bloc_to_historical[opp_bloc]
-            }
+            # Based on first choice, randomly choose
+            # ballots weighted by Cambridge frequency
+            bloc_code = self._cam_codes.get(self.bloc_to_historical[bloc], -1)
+            opp_code = self._cam_codes.get(self.bloc_to_historical[opp_bloc], -1)
+
+            type_indices = []
+            for first_code, num_voters in [
+                (bloc_code, bloc_voters),
+                (opp_code, cross_voters),
+            ]:
+                types, cum_freqs = self._cam_types_by_first[first_code]
+                draws = rng.random(num_voters) * cum_freqs[-1]
+                type_indices.append(
+                    types[np.searchsorted(cum_freqs, draws, side="right")]
+                )
+            historical_types = self._cam_ballots[np.concatenate(type_indices)]
+            num_voters = bloc_voters + cross_voters
 
-            bloc_voter_ordering = random.choices(
-                list(prob_ballot_given_bloc_first.keys()),
-                weights=list(prob_ballot_given_bloc_first.values()),
-                k=bloc_voters,
+            # encode the bloc orderings as 0 for a bloc slot, 1 for an opposing slot
+            # and -1 for padding after the end of the ballot
+            type_matrix = np.where(
+                historical_types == bloc_code, 0, np.where(historical_types < 0, -1, 1)
             )
-            cross_voter_ordering = random.choices(
-                list(prob_ballot_given_opp_first.keys()),
-                weights=list(prob_ballot_given_opp_first.values()),
-                k=cross_voters,
+
+            # Now turn bloc orderings into candidate orderings, using the
+            # Gumbel-top-k trick to draw every PL ordering at once
+            cands = list(pref_interval_dict.interval.keys())
+            scores = np.log(list(pref_interval_dict.interval.values())) + rng.gumbel(
+                size=(num_voters, len(cands))
             )
+            pl_ordering = np.argsort(-scores, axis=1)
 
-            # Generate ballots
-            for i in range(bloc_voters + cross_voters):
-                # Based on first choice, randomly choose
-                # ballots weighted by Cambridge frequency
-                if i < bloc_voters:
-                    bloc_ordering = bloc_voter_ordering[i]
-                else:
-                    bloc_ordering = cross_voter_ordering[i - bloc_voters]
-
-                # Now turn bloc ordering into candidate ordering
-                pl_ordering = list(
-                    np.random.choice(
-                        list(pref_interval_dict.interval.keys()),
-                        len(pref_interval_dict.interval),
-                        p=list(pref_interval_dict.interval.values()),
-                        replace=False,
-                    )
-                )
-                ordered_bloc_slate = [
-                    c for c in pl_ordering if c in self.slate_to_candidates[bloc]
-                ]
-                ordered_opp_slate = [
-                    c for c in pl_ordering if c in self.slate_to_candidates[opp_bloc]
+            # stable partition of each ordering into the bloc slate then the opposing slate
+            slate_key = np.array(
+                [
+                    0
+                    if c in self.slate_to_candidates[bloc]
+                    else 1
+                    if c in self.slate_to_candidates[opp_bloc]
+                    else 2
+                    for c in cands
                 ]
+            )
+            num_bloc_cands = int(np.sum(slate_key == 0))
+            num_opp_cands = int(np.sum(slate_key == 1))
+            slate_ordering = np.take_along_axis(
+                pl_ordering,
+                np.argsort(slate_key[pl_ordering], axis=1, kind="stable"),
+                axis=1,
+            )
 
-                # Fill in the bloc slots as determined
-                # With the candidate ordering generated with PL
-                full_ballot = []
-                for b in bloc_ordering:
-                    if b == self.bloc_to_historical[bloc]:
-                        if ordered_bloc_slate:
-                            full_ballot.append(ordered_bloc_slate.pop(0))
-                    else:
-                        if ordered_opp_slate:
-                            full_ballot.append(ordered_opp_slate.pop(0))
+            # lay out the slates as [bloc slate, -1, opposing slate, -1] so that a slot
+            # whose slate is exhausted picks up the -1 and is dropped
+            padding = np.full((num_voters, 1), -1)
+            slates = np.concatenate(
+                [
+                    slate_ordering[:, :num_bloc_cands],
+                    padding,
+                    slate_ordering[:, num_bloc_cands : num_bloc_cands + num_opp_cands],
+                    padding,
+                ],
+                axis=1,
+            )
 
-                ranking = tuple([frozenset({cand}) for cand in full_ballot])
-                ballot_pool[i] = Ballot(ranking=ranking, weight=Fraction(1, 1))
+            # the k-th bloc slot is filled by the k-th candidate of the bloc slate
+            bloc_slot = np.cumsum(type_matrix == 0, axis=1) - 1
+            opp_slot = np.cumsum(type_matrix == 1, axis=1) - 1
+            slate_index = np.where(
+                type_matrix == 0,
+                np.minimum(bloc_slot, num_bloc_cands),
+                num_bloc_cands + 1 + np.minimum(opp_slot, num_opp_cands),
+            )
+            ballot_pool = np.take_along_axis(slates, slate_index, axis=1)
+            ballot_pool[type_matrix == -1] = -1
 
-            pp = PreferenceProfile(ballots=ballot_pool)
-            pp = pp.condense_ballots()
-            pp_by_bloc[bloc] = pp
+            # move dropped slots to the end so equal ballots are counted together
+            ballot_pool = np.take_along_axis(
+                ballot_pool, np.argsort(ballot_pool < 0, axis=1, kind="stable"), axis=1
+            )
+
+            pp_by_bloc[bloc] = self.ballot_pool_to_profile(ballot_pool, cands)
 
         # combine the profiles
         pp = PreferenceProfile(ballots=[])
@@ -1402,21 +1604,7 @@ class name_Cumulative(BallotGenerator):
         super().__init__(cohesion_parameters=cohesion_parameters, **data)
         self.num_votes = num_votes
 
-        # if dictionary of pref intervals is passed
-        if isinstance(
-            list(self.pref_intervals_by_bloc.values())[0], PreferenceInterval
-        ):
-            self.pref_interval_by_bloc = self.pref_intervals_by_bloc
-
-        # if nested dictionary of pref intervals, combine by cohesion
-        else:
-            self.pref_interval_by_bloc = {
-                bloc: combine_preference_intervals(
-                    [self.pref_intervals_by_bloc[bloc][b] for b in self.blocs],
-                    [self.cohesion_parameters[bloc][b] for b in self.blocs],
-                )
-                for bloc in self.blocs
-            }
+        self._set_pref_interval_by_bloc()
 
     def generate_profile(
         self, number_of_ballots: int, by_bloc: bool = False
@@ -1429,45 +1617,27 @@ class name_Cumulative(BallotGenerator):
                     False if you want the full, aggregated PreferenceProfile.
         """
         # the number of ballots per bloc is determined by Huntington-Hill apportionment
-        bloc_props = list(self.bloc_voter_prop.values())
-        ballots_per_block = dict(
-            zip(
-                self.blocs,
-                apportion.compute("huntington", bloc_props, number_of_ballots),
-            )
-        )
+        ballots_per_block = self._ballots_per_bloc(number_of_ballots)
 
         pp_by_bloc = {b: PreferenceProfile() for b in self.blocs}
 
         for bloc in self.bloc_voter_prop.keys():
-            ballot_pool = []
             # number of voters in this bloc
             num_ballots = ballots_per_block[bloc]
-            pref_interval = self.pref_interval_by_bloc[bloc]
+            pref_arr = self._pref_arr_by_bloc[bloc]
 
             # finds candidates with non-zero preference
-            non_zero_cands = list(pref_interval.non_zero_cands)
-            # creates the interval of probabilities for candidates supported by this block
-            cand_support_vec = [pref_interval.interval[cand] for cand in non_zero_cands]
-
-            for _ in range(num_ballots):
-                # generates ranking based on probability distribution of non zero candidate support
-                list_ranking = list(
-                    np.random.choice(
-                        non_zero_cands,
-                        self.num_votes,
-                        p=cand_support_vec,
-                        replace=True,
-                    )
-                )
-
-                ranking = tuple([frozenset({cand}) for cand in list_ranking])
-
-                ballot_pool.append(Ballot(ranking=ranking, weight=Fraction(1, 1)))
+            non_zero_cands = np.flatnonzero(pref_arr)
+
+            # samples every ballot at once, with replacement, from the candidate support
+            ballot_pool = self._rng.choice(
+                non_zero_cands,
+                (num_ballots, self.num_votes),
+                p=pref_arr[non_zero_cands],
+                replace=True,
+            )
 
-            pp = PreferenceProfile(ballots=ballot_pool)
-            pp = pp.condense_ballots()
-            pp_by_bloc[bloc] = pp
+            pp_by_bloc[bloc] = self.ballot_pool_to_profile(ballot_pool, self.candidates)
 
         # combine the profiles
         pp = PreferenceProfile(ballots=[])
@@ -1526,15 +1696,11 @@ class slate_PlackettLuce(BallotGenerator):
         `by_bloc`: True if you want to return a dictionary of PreferenceProfiles by bloc.
                     False if you want the full, aggregated PreferenceProfile.
         """
-        bloc_props = list(self.bloc_voter_prop.values())
-        ballots_per_block = dict(
-            zip(
-                self.blocs,
-                apportion.compute("huntington", bloc_props, number_of_ballots),
-            )
-        )
+        # the number of ballots per bloc is determined by Huntington-Hill apportionment
+        ballots_per_block = self._ballots_per_bloc(number_of_ballots)
 
         pref_profile_by_bloc = {}
+        slate_prefs = self._slate_pref_vectors()
 
         for i, bloc in enumerate(self.blocs):
             # number of voters in this bloc
@@ -1554,25 +1720,22 @@ class slate_PlackettLuce(BallotGenerator):
                 slate_to_non_zero_candidates=slate_to_non_zero_candidates,
                 num_ballots=num_ballots,
                 cohesion_parameters_for_bloc=self.cohesion_parameters[bloc],
+                rng=self._rng,
             )
 
             for j, bt in enumerate(ballot_types):
                 cand_ordering_by_bloc = {}
 
                 for b in self.blocs:
-                    # create a pref interval dict of only this blocs candidates
-                    bloc_cand_pref_interval = pref_intervals[b].interval
-                    cands = pref_intervals[b].non_zero_cands
+                    cands, distribution = slate_prefs[(bloc, b)]
 
                     # if there are no non-zero candidates, skip this bloc
                     if len(cands) == 0:
                         continue
 
-                    distribution = [bloc_cand_pref_interval[c] for c in cands]
-
                     # sample
-                    cand_ordering = np.random.choice(
-                        a=list(cands), size=len(cands), p=distribution, replace=False
+                    cand_ordering = self._rng.choice(
+                        a=cands, size=len(cands), p=distribution, replace=False
                     )
                     cand_ordering_by_bloc[b] = list(cand_ordering)
 
@@ -1694,7 +1857,7 @@ class slate_BradleyTerry(BallotGenerator):
         b_types = list(pdf.keys())
         probs = list(pdf.values())
 
-        sampled_indices = np.random.choice(len(b_types), size=num_ballots, p=probs)
+        sampled_indices = self._rng.choice(len(b_types), size=num_ballots, p=probs)
 
         return [b_types[i] for i in sampled_indices]
 
@@ -1718,7 +1881,7 @@ class slate_BradleyTerry(BallotGenerator):
         # presample swap indices
         swap_indices = [
             (j1, j1 + 1)
-            for j1 in np.random.choice(len(seed_ballot_type) - 1, size=num_ballots)
+            for j1 in self._rng.integers(len(seed_ballot_type) - 1, size=num_ballots)
         ]
 
         odds = (1 - cohesion) / cohesion
@@ -1739,7 +1902,7 @@ class slate_BradleyTerry(BallotGenerator):
                 acceptance_prob = 1
 
             # if you accept, make the swap
-            if random.random() < acceptance_prob:
+            if self._rng.random() < acceptance_prob:
                 current_ranking[j1], current_ranking[j2] = (
                     current_ranking[j2],
                     current_ranking[j1],
@@ -1772,15 +1935,10 @@ class slate_BradleyTerry(BallotGenerator):
                         False if you want to use MCMC approximation. Defaults to True.
         """
         # the number of ballots per bloc is determined by Huntington-Hill apportionment
-        bloc_props = list(self.bloc_voter_prop.values())
-        ballots_per_block = dict(
-            zip(
-                self.blocs,
-                apportion.compute("huntington", bloc_props, number_of_ballots),
-            )
-        )
+        ballots_per_block = self._ballots_per_bloc(number_of_ballots)
 
         pref_profile_by_bloc = {}
+        slate_prefs = self._slate_pref_vectors()
 
         for i, bloc in enumerate(self.blocs):
             # number of voters in this bloc
@@ -1804,19 +1962,15 @@ class slate_BradleyTerry(BallotGenerator):
                 cand_ordering_by_bloc = {}
 
                 for b in self.blocs:
-                    # create a pref interval dict of only this blocs candidates
-                    bloc_cand_pref_interval = pref_intervals[b].interval
-                    cands = pref_intervals[b].non_zero_cands
+                    cands, distribution = slate_prefs[(bloc, b)]
 
                     # if there are no non-zero candidates, skip this bloc
                     if len(cands) == 0:
                         continue
 
-                    distribution = [bloc_cand_pref_interval[c] for c in cands]
-
                     # sample
-                    cand_ordering = np.random.choice(
-                        a=list(cands), size=len(cands), p=distribution, replace=False
+                    cand_ordering = self._rng.choice(
+                        a=cands, size=len(cands), p=distribution, replace=False
                     )
 
                     cand_ordering_by_bloc[b] = list(cand_ordering)
@@ -11,6 +11,7 @@ from ..pref_profile import PreferenceProfile
 from .transfers import fractional_transfer, seqRCV_transfer
 from ..utils import (
     compute_votes,
+    order_votes,
     remove_cand,
     scores_into_set_list,
     tie_broken_ranking,
@@ -56,6 +57,8 @@ class STV(Election):
     **Methods**
     """
 
+    __slots__ = ("transfer", "seats", "tiebreak", "quota", "threshold")
+
     def __init__(
         self,
         profile: PreferenceProfile,
@@ -97,10 +100,22 @@ class STV(Election):
         Returns:
             True if number of seats has not been met, False otherwise.
         """
+        return self._num_elected() < self.seats
+
+    def _num_elected(self) -> int:
+        """
+        Counts the candidates elected so far by walking back through the election states,
+        without building the list of winners.
+
+        Returns:
+            Number of candidates elected up to the current round.
+        """
         cands_elected = 0
-        for s in self.state.winners():
-            cands_elected += len(s)
-        return cands_elected < self.seats
+        state: Optional[ElectionState] = self.state
+        while state is not None:
+            cands_elected += sum(len(s) for s in state.elected)
+            state = state.previous
+        return cands_elected
 
     def run_step(self) -> ElectionState:
         """
@@ -111,16 +126,20 @@ class STV(Election):
         """
         remaining = self.state.profile.get_candidates()
         ballots = self.state.profile.get_ballots()
-        round_votes, plurality_score = compute_votes(remaining, ballots)
+
+        # the previous round already tallied the first place votes of this profile
+        if self.state.curr_round > 0 and self.state.scores.keys() == set(remaining):
+            plurality_score = dict(self.state.scores)
+            round_votes = order_votes(plurality_score)
+        else:
+            round_votes, plurality_score = compute_votes(remaining, ballots)
 
         elected = []
         eliminated = []
 
         # if number of remaining candidates equals number of remaining seats,
         # everyone is elected
-        if len(remaining) == self.seats - len(
-            [c for s in self.state.winners() for c in s]
-        ):
+        if len(remaining) == self.seats - self._num_elected():
             elected = [{cand} for cand, _ in round_votes]
             remaining = []
             ballots = []
@@ -147,7 +166,7 @@ class STV(Election):
                 new_ballots += cand_to_ballot[cand]
 
             # remove winners from all ballots
-            ballots = remove_cand([c for s in elected for c in s], new_ballots)
+            ballots = remove_cand(set().union(*elected), new_ballots)
 
         # since no one has crossed threshold, eliminate one of the people
         # with least first place votes
@@ -249,6 +268,8 @@ class Limited(Election):
     **Methods**
     """
 
+    __slots__ = ("seats", "k", "tiebreak")
+
     def __init__(
         self,
         profile: PreferenceProfile,
@@ -366,6 +387,8 @@ class Bloc(Election):
     **Methods**
     """
 
+    __slots__ = ("seats", "tiebreak")
+
     def __init__(
         self,
         profile: PreferenceProfile,
@@ -434,6 +457,8 @@ class SNTV(Election):
     **Methods**
     """
 
+    __slots__ = ("seats", "tiebreak")
+
     def __init__(
         self,
         profile: PreferenceProfile,
@@ -505,6 +530,8 @@ class SNTV_STV_Hybrid(Election):
     **Methods**
     """
 
+    __slots__ = ("transfer", "r1_cutoff", "seats", "tiebreak", "stage")
+
     def __init__(
         self,
         profile: PreferenceProfile,
@@ -624,6 +651,8 @@ class TopTwo(Election):
     **Methods**
     """
 
+    __slots__ = ("tiebreak",)
+
     def __init__(
         self,
         profile: PreferenceProfile,
@@ -682,6 +711,8 @@ class DominatingSets(Election):
     **Methods**
     """
 
+    __slots__ = ()
+
     def __init__(self, profile: PreferenceProfile, ballot_ties: bool = True):
         super().__init__(profile, ballot_ties)
 
@@ -758,6 +789,8 @@ class CondoBorda(Election):
     **Methods**
     """
 
+    __slots__ = ("seats", "tiebreak")
+
     def __init__(
         self,
         profile: PreferenceProfile,
@@ -845,6 +878,8 @@ class SequentialRCV(Election):
     **Methods**
     """
 
+    __slots__ = ("seats", "tiebreak")
+
     def __init__(
         self,
         profile: PreferenceProfile,
@@ -942,6 +977,8 @@ class Borda(Election):
     **Methods**
     """
 
+    __slots__ = ("seats", "tiebreak", "_default_score_vector", "score_vector")
+
     def __init__(
         self,
         profile: PreferenceProfile,
@@ -954,6 +991,10 @@ class Borda(Election):
         self.seats = seats
         self.tiebreak = tiebreak
         self.score_vector = score_vector
+        # build the default vector once instead of on every scoring call
+        self._default_score_vector = np.arange(
+            self._profile.max_ballot_length(), 0, -1, dtype=np.float64
+        )
 
     def run_step(self) -> ElectionState:
         """
@@ -963,15 +1004,25 @@ class Borda(Election):
         Returns:
             An ElectionState object for a complete election.
         """
-        borda_dict = borda_scores(
-            profile=self.state.profile, score_vector=self.score_vector
+        score_vector: Union[list, np.ndarray] = (
+            self._default_score_vector
+            if self.score_vector is None
+            else self.score_vector
         )
+        borda_dict = borda_scores(profile=self.state.profile, score_vector=score_vector)
 
         ranking = scores_into_set_list(borda_dict)
 
         if isinstance(self.tiebreak, str):
+            # the borda tiebreak scores with the default vector, which was just done
+            tiebreak_scores = None
+            if self.tiebreak == "borda" and self.score_vector is None:
+                tiebreak_scores = borda_dict
             ranking = tie_broken_ranking(
-                ranking=ranking, profile=self.state.profile, tiebreak=self.tiebreak
+                ranking=ranking,
+                profile=self.state.profile,
+                tiebreak=self.tiebreak,
+                tiebreak_scores=tiebreak_scores,
             )
         else:
             ranking = self.tiebreak(ranking=ranking, profile=self.state.profile)
@@ -1010,6 +1061,8 @@ class Plurality(SNTV):
     methods from `SNTV` to run election.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         profile: PreferenceProfile,
@@ -1048,6 +1101,8 @@ class IRV(STV):
                     ranking of candidates with no ties. Defaults to random tiebreak.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         profile: PreferenceProfile,
@@ -1099,6 +1154,8 @@ class HighestScore(Election):
 
     """
 
+    __slots__ = ("seats", "score_vector", "tiebreak")
+
     def __init__(
         self,
         profile: PreferenceProfile,
@@ -1116,9 +1173,10 @@ class HighestScore(Election):
         self.tiebreak = tiebreak
 
     def run_step(self):
-        # a dictionary whose keys are candidates and values are scores
+        # a dictionary whose keys are candidates and values are scores, the score
+        # vector was already validated in __init__
         vote_tallies = compute_scores_from_vector(
-            profile=self.state.profile, score_vector=self.score_vector
+            profile=self.state.profile, score_vector=self.score_vector, validate=False
         )
 
         # translate scores into ranking of candidates, tie break
@@ -1140,6 +1198,7 @@ class HighestScore(Election):
             elected=elected,
             eliminated_cands=eliminated,
             remaining=[],
+            scores=vote_tallies,
             profile=self.state.profile,
             previous=self.state,
         )
@@ -1179,6 +1238,8 @@ class Cumulative(HighestScore):
     **Methods**
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         profile: PreferenceProfile,
@@ -1186,12 +1247,7 @@ class Cumulative(HighestScore):
         ballot_ties: bool = True,
         tiebreak: Union[str, Callable] = "random",
     ):
-        longest_ballot = 0
-        for ballot in profile.ballots:
-            if len(ballot.ranking) > longest_ballot:
-                longest_ballot = len(ballot.ranking)
-
-        score_vector = [1.0 for _ in range(longest_ballot)]
+        score_vector = [1.0 for _ in range(profile.max_ballot_length())]
         super().__init__(
             profile=profile,
             ballot_ties=ballot_ties,
@@ -1,3 +1,4 @@
+from collections import Counter
 from fractions import Fraction
 import random
 
@@ -61,26 +62,34 @@ def random_transfer(
         Modified ballots with transferred weights and the winning candidate removed.
     """
 
-    # turn all of winner's ballots into (multiple) ballots of weight 1
-    weight_1_ballots = []
+    winner_ballots = []
     updated_ballots = []
     for ballot in ballots:
         if ballot.ranking and ballot.ranking[0] == {winner}:
-            # note: under random transfer, weights should always be integers
-            for _ in range(int(ballot.weight)):
-                weight_1_ballots.append(
-                    Ballot(
-                        id=ballot.id,
-                        ranking=ballot.ranking,
-                        weight=Fraction(1),
-                        voter_set=ballot.voter_set,
-                    )
-                )
+            winner_ballots.append(ballot)
         else:
             updated_ballots.append(ballot)
 
-    surplus_ballots = random.sample(weight_1_ballots, int(votes[winner]) - threshold)
-    updated_ballots += surplus_ballots
+    # sample weight 1 ballots without replacement by drawing indices of the winner's
+    # ballots, each repeated as many times as its weight
+    # note: under random transfer, weights should always be integers
+    surplus_counts = Counter(
+        random.sample(
+            range(len(winner_ballots)),
+            int(votes[winner]) - threshold,
+            counts=[int(ballot.weight) for ballot in winner_ballots],
+        )
+    )
+    for i, count in sorted(surplus_counts.items()):
+        ballot = winner_ballots[i]
+        updated_ballots.append(
+            Ballot(
+                id=ballot.id,
+                ranking=ballot.ranking,
+                weight=Fraction(count),
+                voter_set=ballot.voter_set,
+            )
+        )
 
     return remove_cand(winner, updated_ballots)
 
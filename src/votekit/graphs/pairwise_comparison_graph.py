@@ -1,8 +1,11 @@
 from fractions import Fraction
 from itertools import permutations, combinations
+import math
 import matplotlib.pyplot as plt  # type: ignore
 import networkx as nx  # type: ignore
+import numpy as np
 from functools import cache
+from typing import Optional
 
 from ..ballot import Ballot
 from .base_graph import Graph
@@ -94,6 +97,48 @@ class PairwiseComparisonGraph(Graph):
                     break
         return Fraction(count)
 
+    def head2head_matrix(self) -> Optional[tuple[np.ndarray, int]]:
+        """
+        Counts all head to head comparisons at once from the profile's rank matrix.
+        Entry (i, j) is the number of times `self.candidates[i]` is preferred to
+        `self.candidates[j]`, scaled by the least common denominator of the ballot weights.
+
+        Returns:
+            A tuple of the integer count matrix and the scaling denominator, or None if
+                some ballot has ties or repeated candidates.
+        """
+        encoded = self.profile.rank_matrix()
+        if encoded is None:
+            return None
+        matrix, matrix_cands = encoded
+        matrix_idx = {cand: i for i, cand in enumerate(matrix_cands)}
+        matrix = matrix[:, [matrix_idx[cand] for cand in self.candidates]]
+
+        sorted_ranks = np.sort(matrix, axis=1)
+        if np.any(
+            (sorted_ranks[:, 1:] == sorted_ranks[:, :-1]) & (sorted_ranks[:, 1:] >= 0)
+        ):
+            return None
+
+        # unranked candidates sit after every ranked one
+        positions = np.where(matrix >= 0, matrix, np.iinfo(matrix.dtype).max)
+        num_cands = len(self.candidates)
+        ballots = self.profile.get_ballots()
+
+        denom = math.lcm(*(Fraction(b.weight).denominator for b in ballots))
+        scaled = [
+            Fraction(b.weight).numerator * (denom // Fraction(b.weight).denominator)
+            for b in ballots
+        ]
+        if sum(abs(w) for w in scaled) >= 2**62:
+            return None
+        weights = np.array(scaled, dtype=np.int64)
+
+        counts = np.zeros((num_cands, num_cands), dtype=np.int64)
+        for i in range(num_cands):
+            counts[i] = weights @ (positions[:, [i]] < positions)
+        return counts, denom
+
     def compute_pairwise_dict(self) -> dict:
         """
         Constructs dictionary where keys are tuples (cand_a, cand_b) containing
@@ -105,19 +150,24 @@ class PairwiseComparisonGraph(Graph):
                 to cand_b.
         """
         pairwise_dict = {}  # {(cand_a, cand_b): freq cand_a is preferred over cand_b}
-        cand_pairs = combinations(self.candidates, 2)
-
-        for pair in cand_pairs:
-            cand_a, cand_b = pair[0], pair[1]
+        cand_pairs = combinations(range(len(self.candidates)), 2)
+        h2h_matrix = self.head2head_matrix()
+
+        for i, j in cand_pairs:
+            cand_a, cand_b = self.candidates[i], self.candidates[j]
+            if h2h_matrix is None:
+                a_over_b = self.head2head_count(cand_a, cand_b)
+                b_over_a = self.head2head_count(cand_b, cand_a)
+            else:
+                counts, denom = h2h_matrix
+                a_over_b = Fraction(int(counts[i, j]), denom)
+                b_over_a = Fraction(int(counts[j, i]), denom)
             head_2_head_dict = {
-                (cand_a, cand_b): self.head2head_count(cand_a, cand_b),
-                (cand_b, cand_a): self.head2head_count(cand_b, cand_a),
+                (cand_a, cand_b): a_over_b,
+                (cand_b, cand_a): b_over_a,
             }
             max_pair = max(zip(head_2_head_dict.values(), head_2_head_dict.keys()))
-            pairwise_dict[max_pair[1]] = abs(
-                self.head2head_count(cand_a, cand_b)
-                - self.head2head_count(cand_b, cand_a)
-            )
+            pairwise_dict[max_pair[1]] = abs(a_over_b - b_over_a)
 
             ## would display x:y instead of abs(x-y)
             # winner, loser = max_pair[1]
@@ -214,23 +264,14 @@ class PairwiseComparisonGraph(Graph):
         Returns:
             A list of dominating tiers.
         """
-        beat_set_size_dict = {}
-        for i, cand in enumerate(self.candidates):
-            beat_set = set()
-            for j, other_cand in enumerate(self.candidates):
-                if i != j:
-                    if nx.has_path(self.pairwise_graph, cand, other_cand):
-                        beat_set.add(other_cand)
-            beat_set_size_dict[cand] = len(beat_set)
-
-        # We want to return candidates sorted and grouped by beat set size
-        tier_dict: dict = {}
-        for k, v in beat_set_size_dict.items():
-            if v in tier_dict.keys():
-                tier_dict[v].add(k)
-            else:
-                tier_dict[v] = {k}
-        tier_list = [tier_dict[k] for k in sorted(tier_dict.keys(), reverse=True)]
+        # every pair of candidates shares an edge, so the strongly connected
+        # components form a chain and each one is a tier; a Condorcet winner
+        # is simply a singleton component at the top
+        condensed = nx.condensation(self.pairwise_graph)
+        tier_list = [
+            set(condensed.nodes[node]["members"])
+            for node in nx.topological_sort(condensed)
+        ]
         return tier_list
 
     def has_condorcet_cycles(self) -> bool:
@@ -3,7 +3,7 @@ from typing import Any
 
 from .election_state import ElectionState
 from .pref_profile import PreferenceProfile
-from .utils import recursively_fix_ties, fix_ties
+from .utils import fix_ties
 
 
 class Election(ABC):
@@ -16,6 +16,8 @@ class Election(ABC):
         ballot_ties: an optional Bool, defaults to True. If True, resolve ties on ballots.
     """
 
+    __slots__ = ("_profile", "state")
+
     def __init__(self, profile: PreferenceProfile, ballot_ties: bool = True):
         if ballot_ties:
             self._profile = self.resolve_input_ties(profile)
@@ -84,13 +86,7 @@ class Election(ABC):
             if not any(len(rank) > 1 for rank in ballot.ranking):
                 new_ballots.append(ballot)
             else:
-                num_ties = 0
-                for rank in ballot.ranking:
-                    if len(rank) > 1:
-                        num_ties += 1
-
-                resolved_ties = fix_ties(ballot)
-                new_ballots += recursively_fix_ties(resolved_ties, num_ties)
+                new_ballots += fix_ties(ballot)
 
         return PreferenceProfile(ballots=new_ballots)
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import numpy as np
 import types
+from typing import Optional
 
 
 def combine_preference_intervals(
@@ -90,13 +91,21 @@ class PreferenceInterval:
         self._normalize()
 
     @classmethod
-    def from_dirichlet(cls, candidates: list[str], alpha: float):
+    def from_dirichlet(
+        cls,
+        candidates: list[str],
+        alpha: float,
+        rng: Optional[np.random.Generator] = None,
+    ):
         """
         Samples a PreferenceInterval from the Dirichlet distribution on the candidate simplex.
         Alpha tends to 0 is strong support, alpha tends to infinity is uniform support, alpha = 1
-        is all bets are off.
+        is all bets are off. A generator `rng` can be passed to control the randomness.
         """
-        probs = list(np.random.default_rng().dirichlet(alpha=[alpha] * len(candidates)))
+        if rng is None:
+            rng = np.random.default_rng()
+
+        probs = list(rng.dirichlet(alpha=[alpha] * len(candidates)))
 
         return cls({c: s for c, s in zip(candidates, probs)})
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 import csv
 from fractions import Fraction
 import pandas as pd
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, PrivateAttr, validator
 from typing import Optional
 import numpy as np
 from .ballot import Ballot
@@ -15,7 +15,8 @@ class PreferenceProfile(BaseModel):
     **Attributes**
 
     `ballots`
-    :   list of `Ballot` objects.
+    :   list of `Ballot` objects. Assign a new list rather than mutating it in place, since
+        values computed from the ballots are cached.
 
     `candidates`
     :   list of candidates.
@@ -26,6 +27,15 @@ class PreferenceProfile(BaseModel):
     ballots: list[Ballot] = []
     candidates: Optional[list] = None
     df: pd.DataFrame = pd.DataFrame()
+    _max_ballot_length: Optional[int] = PrivateAttr(default=None)
+    _rank_matrix: Optional[tuple] = PrivateAttr(default=None)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # drop the values cached from the old ballots
+        if name == "ballots":
+            self._max_ballot_length = None
+            self._rank_matrix = None
 
     @validator("candidates")
     def cands_must_be_unique(cls, candidates: list) -> list:
@@ -58,6 +68,77 @@ class PreferenceProfile(BaseModel):
         else:
             return self.candidates
 
+    def max_ballot_length(self) -> int:
+        """
+        Computes the length of the longest ballot once and caches it.
+
+        Returns:
+            Length of the longest ballot, 0 if there are no ballots.
+        """
+        if self._max_ballot_length is None:
+            self._max_ballot_length = max(
+                (len(ballot.ranking) for ballot in self.ballots), default=0
+            )
+        return self._max_ballot_length
+
+    def rank_matrix(self) -> Optional[tuple[np.ndarray, list]]:
+        """
+        Encodes the ballots as an integer matrix whose (i, j) entry is the position in
+        which ballot i ranks candidate j, or -1 if candidate j is unranked. Tied candidates
+        share a position. The matrix is computed once and cached.
+
+        Returns:
+            A tuple of the matrix and the list of candidates indexing its columns, or None
+                if some ballot ranks a candidate more than once.
+        """
+        if self._rank_matrix is None:
+            candidates = self.get_candidates()
+            cand_to_idx = {cand: i for i, cand in enumerate(candidates)}
+
+            # flatten the ballots into their ranks and the ranks into their candidates,
+            # then recover each entry's ballot and position by repeating the indices
+            ballot_lengths = np.fromiter(
+                (len(ballot.ranking) for ballot in self.ballots),
+                dtype=np.int64,
+                count=len(self.ballots),
+            )
+            rank_sizes = np.fromiter(
+                (len(s) for ballot in self.ballots for s in ballot.ranking),
+                dtype=np.int64,
+                count=int(ballot_lengths.sum()),
+            )
+            cols = np.fromiter(
+                (
+                    cand_to_idx[cand]
+                    for ballot in self.ballots
+                    for s in ballot.ranking
+                    for cand in s
+                ),
+                dtype=np.int64,
+                count=int(rank_sizes.sum()),
+            )
+
+            ballot_starts = np.cumsum(ballot_lengths) - ballot_lengths
+            rank_rows = np.repeat(np.arange(len(self.ballots)), ballot_lengths)
+            positions = np.arange(len(rank_sizes)) - ballot_starts[rank_rows]
+            rows = np.repeat(rank_rows, rank_sizes)
+            ranks = np.repeat(positions, rank_sizes)
+            num_ranked = np.bincount(rows, minlength=len(self.ballots))
+
+            matrix = np.full((len(self.ballots), len(candidates)), -1, dtype=np.int32)
+            matrix[rows, cols] = ranks
+
+            # a repeated candidate overwrites its earlier position
+            if np.array_equal(np.count_nonzero(matrix >= 0, axis=1), num_ranked):
+                self._rank_matrix = (matrix, candidates)
+            else:
+                self._rank_matrix = (None, candidates)
+
+        matrix, candidates = self._rank_matrix
+        if matrix is None:
+            return None
+        return matrix, candidates
+
     # can also cache
     def num_ballots(self) -> Fraction:
         """
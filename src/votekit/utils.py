@@ -1,8 +1,9 @@
 from collections import namedtuple
+from functools import lru_cache
 from fractions import Fraction
 import numpy as np
 from typing import Union, Iterable, Optional, Any
-from itertools import permutations
+from itertools import accumulate, chain, permutations, product
 import math
 import warnings
 
@@ -82,13 +83,24 @@ def compute_votes(
         else:
             votes[first_place_cand] += ballot.weight
 
-    ordered = [
+    return order_votes(votes), votes
+
+
+def order_votes(votes: dict) -> list[CandidateVotes]:
+    """
+    Orders a dictionary of candidate votes.
+
+    Args:
+        votes: A dictionary whose keys are candidates and values are votes.
+
+    Returns:
+        A list of tuples (cand, votes) ordered by decreasing votes.
+    """
+    return [
         CandidateVotes(cand=key, votes=value)
         for key, value in sorted(votes.items(), key=lambda x: x[1], reverse=True)
     ]
 
-    return ordered, votes
-
 
 def remove_cand(removed: Union[str, Iterable], ballots: list[Ballot]) -> list[Ballot]:
     """
@@ -107,39 +119,46 @@ def remove_cand(removed: Union[str, Iterable], ballots: list[Ballot]) -> list[Ba
     elif isinstance(removed, Iterable):
         remove_set = set(removed)
 
-    update = []
-    for ballot in ballots:
-        new_ranking = []
-        if len(remove_set) == 1 and remove_set in ballot.ranking:
-            for s in ballot.ranking:
-                new_s = s.difference(remove_set)
-                if new_s:
-                    new_ranking.append(new_s)
-            update.append(
-                Ballot(
-                    id=ballot.id,
-                    ranking=tuple(new_ranking),
-                    weight=ballot.weight,
-                    voter_set=ballot.voter_set,
-                )
-            )
-        elif len(remove_set) > 1:
-            for s in ballot.ranking:
-                new_s = s.difference(remove_set)
-                if new_s:
-                    new_ranking.append(new_s)
-            update.append(
-                Ballot(
-                    id=ballot.id,
-                    ranking=tuple(new_ranking),
-                    weight=ballot.weight,
-                    voter_set=ballot.voter_set,
-                )
-            )
-        else:
-            update.append(ballot)
+    # a single candidate is only removed where it is ranked alone
+    if len(remove_set) == 1:
+        return [
+            _remove_from_ballot(ballot, remove_set)
+            if remove_set in ballot.ranking
+            else ballot
+            for ballot in ballots
+        ]
 
-    return update
+    # ballots without any removed candidate are shared rather than copied
+    return [
+        ballot
+        if all(remove_set.isdisjoint(s) for s in ballot.ranking)
+        else _remove_from_ballot(ballot, remove_set)
+        for ballot in ballots
+    ]
+
+
+def _remove_from_ballot(ballot: Ballot, remove_set: set) -> Ballot:
+    """
+    Copies a ballot without the given candidates, dropping positions left empty.
+
+    Args:
+        ballot: Ballot to remove candidates from.
+        remove_set: Set of candidates to be removed.
+
+    Returns:
+        A new Ballot with the candidates removed.
+    """
+    new_ranking = []
+    for s in ballot.ranking:
+        new_s = s.difference(remove_set)
+        if new_s:
+            new_ranking.append(new_s)
+    return Ballot(
+        id=ballot.id,
+        ranking=tuple(new_ranking),
+        weight=ballot.weight,
+        voter_set=ballot.voter_set,
+    )
 
 
 # Summmary Stat functions
@@ -196,10 +215,146 @@ def mentions(profile: PreferenceProfile) -> dict:
     return mentions
 
 
+def _score_prefix_sums(score_vector: Union[list, np.ndarray]) -> list:
+    """
+    Running totals of a score vector, so that the points of positions i through j - 1 are
+    `prefix[j] - prefix[i]` without summing the slice. Whole number scores are totalled as
+    integers and other scores as Fractions, so the differences are exact.
+
+    Args:
+        score_vector: Borda weights.
+
+    Returns:
+        List of length `len(score_vector) + 1` starting at 0.
+    """
+    scores = list(score_vector)
+    if all(float(score).is_integer() for score in scores):
+        scores = [int(score) for score in scores]
+    else:
+        scores = [Fraction(score) for score in scores]
+
+    return [0, *accumulate(scores)]
+
+
+def _position_points(
+    score_vector: Union[list, np.ndarray], prefix: list, start: int, end: int
+) -> Any:
+    """
+    Total points of positions `start` through `end - 1`, read straight from the score
+    vector for a single position and from the prefix sums otherwise.
+    """
+    if end - start == 1:
+        return score_vector[start]
+
+    return prefix[end] - prefix[start]
+
+
+def _borda_scores_vectorized(
+    profile: PreferenceProfile,
+    candidates: list,
+    score_vector: Union[list, np.ndarray],
+) -> Optional[dict]:
+    """
+    Computes `borda_scores` by tallying the profile's rank matrix with numpy. Only used
+    for profiles with whole number weights and no repeated candidates.
+
+    Args:
+        profile: Inputed PreferenceProfile of ballots.
+        candidates: The candidates of the profile.
+        score_vector: Borda weights.
+
+    Returns:
+        (dict): Dictionary of candidates (keys) and Borda scores (values), or None if the
+            profile has repeated candidates or fractional weights.
+    """
+    encoded = profile.rank_matrix()
+    if encoded is None or any(b.weight.denominator != 1 for b in profile.ballots):
+        return None
+    matrix, matrix_cands = encoded
+    matrix_idx = {c: i for i, c in enumerate(matrix_cands)}
+    matrix = matrix[:, [matrix_idx[c] for c in candidates]]
+    cand_to_idx = {c: i for i, c in enumerate(candidates)}
+    weights = np.array([b.weight.numerator for b in profile.ballots], dtype=np.int64)
+
+    entry_rows, ranked = np.nonzero(matrix >= 0)
+    positions = matrix[entry_rows, ranked].astype(np.int64)
+    entry_weights = weights[entry_rows]
+    lengths = np.count_nonzero(matrix >= 0, axis=1)
+
+    # group the entries by (ballot, position); groups come out sorted by ballot, so the
+    # start of a group is the number of entries before it in its own ballot
+    num_positions = int(positions.max(initial=-1)) + 1
+    _, group_first, group_idx, group_sizes = np.unique(
+        entry_rows * num_positions + positions,
+        return_index=True,
+        return_inverse=True,
+        return_counts=True,
+    )
+    group_rows = entry_rows[group_first]
+    entries_before = np.cumsum(group_sizes) - group_sizes
+    first_group = np.searchsorted(group_rows, group_rows)
+    starts = (entries_before - entries_before[first_group])[group_idx]
+    sizes = group_sizes[group_idx]
+
+    # weight of the ballots ranking each candidate in each (start, size) position
+    max_size = int(sizes.max(initial=0))
+    slots, slot_idx = np.unique(starts * (max_size + 1) + sizes, return_inverse=True)
+    slot_weight = np.zeros((len(candidates), len(slots)), dtype=np.int64)
+    np.add.at(slot_weight, (ranked, slot_idx), entry_weights)
+
+    # weight of the ballots of each length that leave each candidate unranked, which
+    # split the remaining points evenly over those candidates
+    max_length = int(lengths.max(initial=0))
+    length_weight = np.zeros(max_length + 1, dtype=np.int64)
+    np.add.at(length_weight, lengths, weights)
+    ranked_weight = np.zeros((len(candidates), max_length + 1), dtype=np.int64)
+    np.add.at(ranked_weight, (ranked, lengths[entry_rows]), entry_weights)
+    unranked_weight = length_weight[None, :] - ranked_weight
+
+    # tied candidates split the points of the positions they cover
+    prefix = _score_prefix_sums(score_vector)
+    slot_scores = []
+    for slot in slots:
+        start, size = divmod(int(slot), max_size + 1)
+        end = min(start + size, len(score_vector))
+        start = min(start, end)
+        points = _position_points(score_vector, prefix, start, end)
+        slot_scores.append(Fraction(points / size))
+    remainder_scores = [
+        Fraction(
+            _position_points(score_vector, prefix, k, len(score_vector))
+            / (len(candidates) - k)
+        )
+        if k < len(candidates)
+        else Fraction(0)
+        for k in range(len(score_vector))
+    ]
+
+    candidate_borda = {}
+    for c, i in cand_to_idx.items():
+        candidate_borda[c] = sum(
+            (
+                score * int(weight)
+                for score, weight in zip(slot_scores, slot_weight[i])
+                if weight
+            ),
+            Fraction(0),
+        ) + sum(
+            (
+                score * int(weight)
+                for score, weight in zip(remainder_scores, unranked_weight[i])
+                if weight
+            ),
+            Fraction(0),
+        )
+
+    return candidate_borda
+
+
 def borda_scores(
     profile: PreferenceProfile,
     ballot_length: Optional[int] = None,
-    score_vector: Optional[list] = None,
+    score_vector: Optional[Union[list, np.ndarray]] = None,
 ) -> dict:
     """
     Calculates Borda scores for a PreferenceProfile.
@@ -215,30 +370,37 @@ def borda_scores(
     """
     candidates = profile.get_candidates()
     if ballot_length is None:
-        ballot_length = max([len(ballot.ranking) for ballot in profile.ballots])
+        ballot_length = profile.max_ballot_length()
     if score_vector is None:
-        score_vector = list(range(ballot_length, 0, -1))
+        score_vector = np.arange(ballot_length, 0, -1, dtype=np.float64)
 
+    fast_scores = _borda_scores_vectorized(profile, candidates, score_vector)
+    if fast_scores is not None:
+        return fast_scores
+
+    prefix = _score_prefix_sums(score_vector)
     candidate_borda = {c: Fraction(0) for c in candidates}
     for ballot in profile.ballots:
         current_ind = 0
         candidates_covered = []
         for s in ballot.ranking:
             position_size = len(s)
-            local_score_vector = score_vector[current_ind : current_ind + position_size]
-            borda_allocation = sum(local_score_vector) / position_size
+            end = min(current_ind + position_size, len(score_vector))
+            start = min(current_ind, end)
+            borda_allocation = (
+                _position_points(score_vector, prefix, start, end) / position_size
+            )
             for c in s:
                 candidate_borda[c] += Fraction(borda_allocation) * ballot.weight
             current_ind += position_size
             candidates_covered += list(s)
 
         # If ballot was incomplete, evenly allocation remaining points
-        if current_ind < len(score_vector):
-            remainder_cands = set(candidates).difference(set(candidates_covered))
-            remainder_score_vector = score_vector[current_ind:]
-            remainder_borda_allocation = sum(remainder_score_vector) / len(
-                remainder_cands
-            )
+        remainder_cands = set(candidates).difference(set(candidates_covered))
+        if current_ind < len(score_vector) and remainder_cands:
+            remainder_borda_allocation = _position_points(
+                score_vector, prefix, current_ind, len(score_vector)
+            ) / len(remainder_cands)
             for c in remainder_cands:
                 candidate_borda[c] += (
                     Fraction(remainder_borda_allocation) * ballot.weight
@@ -288,7 +450,10 @@ def candidate_position_dict(ranking: list[set[str]]) -> dict:
 
 
 def tie_broken_ranking(
-    ranking: list[set[str]], profile: PreferenceProfile, tiebreak: str = "none"
+    ranking: list[set[str]],
+    profile: PreferenceProfile,
+    tiebreak: str = "none",
+    tiebreak_scores: Optional[dict] = None,
 ) -> list[set[str]]:
     """
     Breaks ties in a list-of-sets ranking according to a given scheme.
@@ -297,6 +462,8 @@ def tie_broken_ranking(
         ranking: A list-of-set ranking of candidates.
         profile: PreferenceProfile.
         tiebreak: Method of tiebreak, currently supports 'none', 'random', 'borda', 'firstplace'.
+        tiebreak_scores: (optional) Precomputed scores of `profile` for the 'borda' or
+            'firstplace' tiebreak. Computed from `profile` if None.
 
     Returns:
         A list-of-set ranking of candidates (tie broken down to one candidate sets unless
@@ -311,12 +478,14 @@ def tie_broken_ranking(
             shuffled_s = list(np.random.permutation(list(s)))
             new_ranking += [{c} for c in shuffled_s]
     elif tiebreak == "firstplace":
-        tiebreak_scores = first_place_votes(profile)
+        if tiebreak_scores is None:
+            tiebreak_scores = first_place_votes(profile)
         for s in ranking:
             ordered_set = scores_into_set_list(tiebreak_scores, s)
             new_ranking += ordered_set
     elif tiebreak == "borda":
-        tiebreak_scores = borda_scores(profile)
+        if tiebreak_scores is None:
+            tiebreak_scores = borda_scores(profile)
         for s in ranking:
             ordered_set = scores_into_set_list(tiebreak_scores, s)
             new_ranking += ordered_set
@@ -363,7 +532,9 @@ def scores_into_set_list(
 
 
 def compute_scores_from_vector(
-    profile: PreferenceProfile, score_vector: list[float]
+    profile: PreferenceProfile,
+    score_vector: Union[list[float], np.ndarray],
+    validate: bool = True,
 ) -> dict:
     """
     Computes the scores received by each candidate given the score vector and the profile.
@@ -374,45 +545,63 @@ def compute_scores_from_vector(
         score_vector: List of floats where ith position denotes points given to candidates
                     in position i.
 
+        validate: (optional) If False, skips checking the score vector, for callers that
+                    have already validated it. Defaults to True.
+
     Returns:
         A dictionary whose keys are candidates and values are scores.
     """
     # check for valid score vector
-    validate_score_vector(score_vector)
+    if validate:
+        validate_score_vector(score_vector)
 
     candidates_to_scores = {c: 0.0 for c in profile.get_candidates()}
 
+    # check every ballot length in one pass, and warn once if any ballot is longer than
+    # the score vector
+    ballot_lengths = np.fromiter(
+        (len(ballot.ranking) for ballot in profile.ballots),
+        dtype=np.int64,
+        count=len(profile.ballots),
+    )
+    if np.any(ballot_lengths > len(score_vector)):
+        longest = int(ballot_lengths[np.argmax(ballot_lengths)])
+        warnings.warn(
+            f"Tried to access index {longest - 1} of score vector, "
+            f"but vector only length {len(score_vector)}. "
+            "Assigned candidates past the end of the score vector 0 points.",
+            UserWarning,
+        )
+
     for ballot in profile.ballots:
-        for i, s in enumerate(ballot.ranking):
-            # for each candidate in position i, give them points as determined by score_vector
+        for score, s in zip(score_vector, ballot.ranking):
+            # give each candidate in this position the points determined by score_vector
             for c in s:
-                try:
-                    candidates_to_scores[c] += score_vector[i] * ballot.weight
-                except IndexError:
-                    warnings.warn(
-                        f"Tried to access index {i} of score vector,"
-                        f"but vector only length {len(score_vector)}. "
-                        "Assigned candidate 0 points.",
-                        UserWarning,
-                    )
+                candidates_to_scores[c] += score * ballot.weight
 
     return candidates_to_scores
 
 
-def validate_score_vector(score_vector: list[float]):
+def validate_score_vector(score_vector: Union[list[float], np.ndarray]):
     """
     Validator function for score vectors. Vectors should be non-increasing and non-negative.
+    Accepts lists or numpy arrays.
     """
+    scores = np.asarray(score_vector)
+    if not len(scores):
+        return
 
-    for i, score in enumerate(score_vector):
-        # if score is negative
-        if score < 0:
-            raise ValueError("Score vector must be non-negative.")
+    # positions whose score is smaller than the next one
+    increasing = np.flatnonzero(np.diff(scores) > 0)
 
-        if i > 0:
-            # if the current score is bigger than prev
-            if score > score_vector[i - 1]:
-                raise ValueError("Score vector must be non-increasing.")
+    # the smallest score before the first increase is the one right before it,
+    # so a single lookup tells whether a negative score comes first
+    last_non_increasing = increasing[0] if len(increasing) else len(scores) - 1
+    if scores[last_non_increasing] < 0:
+        raise ValueError("Score vector must be non-negative.")
+
+    if len(increasing):
+        raise ValueError("Score vector must be non-increasing.")
 
 
 def elect_cands_from_set_ranking(
@@ -450,35 +639,37 @@ def elect_cands_from_set_ranking(
 
 
 # helper functions for Election base class
-def recursively_fix_ties(ballot_lst: list[Ballot], num_ties: int) -> list[Ballot]:
+def _permuted_ranks(rank: frozenset) -> tuple:
+    """
+    Every way of writing out a rank as a sequence of singleton ranks.
     """
-    Recursively fixes ties in a ballot in the case there is more then one tie.
+    return tuple(
+        tuple(frozenset({cand}) for cand in order) for order in permutations(rank)
+    )
 
-    Args:
-        ballot_lst (list): List of Ballot objects
-        num_ties (int):  Number of ties to resolve.
 
-    Returns:
-        (list): A list of Ballots with ties resolved.
+_cached_permuted_ranks = lru_cache(maxsize=256)(_permuted_ranks)
+
+
+def _rank_orders(rank: frozenset) -> tuple:
+    """
+    Every way of writing out a rank as a sequence of singleton ranks. Ranks of at most
+    six candidates are cached since the same tied ranks tend to recur across the ballots
+    of a profile; larger ranks have too many orderings to keep alive.
     """
-    # base case, if only one tie to resolved return the list of already
-    # resolved ballots
-    if num_ties == 1:
-        return ballot_lst
+    if len(rank) == 1:
+        return ((rank,),)
 
-    # in the event multiple positions have ties
-    else:
-        update = set()
-        for ballot in ballot_lst:
-            update.update(set(fix_ties(ballot)))
+    if len(rank) <= 6:
+        return _cached_permuted_ranks(rank)
 
-        return recursively_fix_ties(list(update), num_ties - 1)
+    return _permuted_ranks(rank)
 
 
 def fix_ties(ballot: Ballot) -> list[Ballot]:
     """
-    Helper function for recursively_fix_ties. Resolves the first appearing
-    tied rank in the input ballot.
+    Helper function for resolve_input_ties. Resolves every tied rank in the input
+    ballot at once, splitting its weight evenly over all orderings of the tied candidates.
 
     Args:
         ballot: A Ballot.
@@ -486,23 +677,19 @@ def fix_ties(ballot: Ballot) -> list[Ballot]:
     Returns:
         (list): List of Ballots that are permutations of the tied ballot.
     """
+    rank_orders = [_rank_orders(rank) for rank in ballot.ranking]
+    # the number of orderings of a tied rank of size k is k!
+    weight = ballot.weight / math.prod(len(orders) for orders in rank_orders)
 
     ballots = []
-    for idx, rank in enumerate(ballot.ranking):
-        if len(rank) > 1:
-            for order in permutations(rank):
-                resolved = []
-                for cand in order:
-                    resolved.append(frozenset(cand))
-                ballots.append(
-                    Ballot(
-                        id=ballot.id,
-                        ranking=ballot.ranking[:idx]
-                        + tuple(resolved)
-                        + ballot.ranking[idx + 1 :],
-                        weight=ballot.weight / math.factorial(len(rank)),
-                        voter_set=ballot.voter_set,
-                    )
-                )
+    for resolved in product(*rank_orders):
+        ballots.append(
+            Ballot(
+                id=ballot.id,
+                ranking=tuple(chain.from_iterable(resolved)),
+                weight=weight,
+                voter_set=ballot.voter_set,
+            )
+        )
 
     return ballots
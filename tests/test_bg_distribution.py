@@ -22,8 +22,8 @@ from votekit.pref_profile import PreferenceProfile
 from votekit.pref_interval import PreferenceInterval, combine_preference_intervals
 from votekit import Ballot
 
-# set seed for more consistent tests
-np.random.seed(8675309)
+# seed the generators for more consistent tests
+SEED = 8675309
 
 
 def binomial_confidence_interval(probability, n_attempts, alpha=0.95):
@@ -88,6 +88,7 @@ def test_ic_distribution():
     # Generate ballots
     generated_profile = ImpartialCulture(
         candidates=candidates,
+        seed=SEED,
     ).generate_profile(number_of_ballots=number_of_ballots)
 
     # Test
@@ -105,7 +106,7 @@ def test_ballot_simplex_from_point():
     }
 
     generated_profile = BallotSimplex.from_point(
-        point=pt, candidates=candidates
+        point=pt, candidates=candidates, seed=SEED
     ).generate_profile(number_of_ballots=number_of_ballots)
     # Test
     assert do_ballot_probs_match_ballot_dist(ballot_prob_dict, generated_profile)
@@ -118,7 +119,7 @@ def test_iac_distribution():
 
     # Find ballot probs
     possible_rankings = list(it.permutations(candidates, ballot_length))
-    probabilities = np.random.dirichlet([1] * len(possible_rankings))
+    probabilities = np.random.default_rng(SEED).dirichlet([1] * len(possible_rankings))
 
     ballot_prob_dict = {
         possible_rankings[b_ind]: probabilities[b_ind]
@@ -127,6 +128,7 @@ def test_iac_distribution():
     generated_profile = ImpartialAnonymousCulture(
         number_of_ballots=number_of_ballots,
         candidates=candidates,
+        seed=SEED,
     ).generate_profile(number_of_ballots=500)
 
     # Test
@@ -157,6 +159,7 @@ def test_NPL_distribution():
         pref_intervals_by_bloc=pref_intervals_by_bloc,
         bloc_voter_prop=bloc_voter_prop,
         cohesion_parameters=cohesion_parameters,
+        seed=SEED,
     )
 
     generated_profile = pl.generate_profile(number_of_ballots=number_of_ballots)
@@ -205,6 +208,7 @@ def test_SPL_distribution():
         bloc_voter_prop=bloc_voter_prop,
         cohesion_parameters=cohesion_parameters,
         slate_to_candidates=slate_to_candidates,
+        seed=SEED,
     ).generate_profile(number_of_ballots=number_of_ballots, by_bloc=True)
 
     blocs = list(bloc_voter_prop.keys())
@@ -286,6 +290,7 @@ def test_NBT_distribution():
         pref_intervals_by_bloc=pref_intervals_by_bloc,
         bloc_voter_prop=bloc_voter_prop,
         cohesion_parameters=cohesion_parameters,
+        seed=SEED,
     )
     generated_profile = bt.generate_profile(number_of_ballots=number_of_ballots)
 
@@ -353,6 +358,7 @@ def test_NBT_3_bloc():
         pref_intervals_by_bloc=pref_intervals_by_bloc,
         bloc_voter_prop=bloc_voter_prop,
         candidates=candidates,
+        seed=SEED,
     )
 
     profile = bt.generate_profile(500)
@@ -382,6 +388,7 @@ def test_NBT_3_bloc():
         alphas=alphas,
         bloc_voter_prop=bloc_voter_prop,
         candidates=candidates,
+        seed=SEED,
     )
 
     assert len(bt.pref_intervals_by_bloc["A"]) == 3
@@ -428,6 +435,7 @@ def test_SPL_3_bloc():
         pref_intervals_by_bloc=pref_intervals_by_bloc,
         bloc_voter_prop=bloc_voter_prop,
         candidates=candidates,
+        seed=SEED,
     )
 
     profile = sp.generate_profile(500)
@@ -473,6 +481,7 @@ def test_SPL_3_bloc():
         alphas=alphas,
         bloc_voter_prop=bloc_voter_prop,
         candidates=candidates,
+        seed=SEED,
     )
 
     assert len(sp.pref_intervals_by_bloc["A"]) == 3
@@ -503,6 +512,7 @@ def test_NBT_probability_calculation():
         pref_intervals_by_bloc=pref_intervals_by_bloc,
         bloc_voter_prop=bloc_voter_prop,
         cohesion_parameters=cohesion_parameters,
+        seed=SEED,
     )
 
     permutation = ("W1", "W2")
@@ -619,12 +629,68 @@ def test_AC_distribution():
         bloc_voter_prop=bloc_voter_prop,
         slate_to_candidates=slate_to_candidate,
         cohesion_parameters=cohesion_parameters,
+        seed=SEED,
     ).generate_profile(number_of_ballots=number_of_ballots)
 
     # Test
     assert do_ballot_probs_match_ballot_dist(ballot_prob_dict, generated_profile)
 
 
+def test_AC_ballot_order_by_bloc():
+    # regression test: each voter's slate orderings are drawn from the original preference
+    # intervals, not from the previous voter's sampled ordering
+    number_of_ballots = 2000
+    slate_to_candidates = {"W": ["W1", "W2", "W3"], "C": ["C1", "C2"]}
+    pref_intervals_by_bloc = {
+        "W": {
+            "W": PreferenceInterval({"W1": 0.7, "W2": 0.2, "W3": 0.1}),
+            "C": PreferenceInterval({"C1": 0.8, "C2": 0.2}),
+        },
+        "C": {
+            "W": PreferenceInterval({"W1": 0.1, "W2": 0.1, "W3": 0.8}),
+            "C": PreferenceInterval({"C1": 0.5, "C2": 0.5}),
+        },
+    }
+
+    pp_by_bloc, _ = AlternatingCrossover(
+        candidates=["W1", "W2", "W3", "C1", "C2"],
+        pref_intervals_by_bloc=pref_intervals_by_bloc,
+        bloc_voter_prop={"W": 1, "C": 0},
+        slate_to_candidates=slate_to_candidates,
+        cohesion_parameters={"W": {"W": 0.8, "C": 0.2}, "C": {"C": 0.8, "W": 0.2}},
+        seed=11,
+    ).generate_profile(number_of_ballots=number_of_ballots, by_bloc=True)
+
+    bloc_orders = {}
+    cross_orders = {}
+    for ballot in pp_by_bloc["W"].ballots:
+        ranking = tuple(next(iter(s)) for s in ballot.ranking)
+        if len(ranking) == 5:
+            # bloc voters rank their whole slate first
+            assert set(ranking[:3]) == set(slate_to_candidates["W"])
+            bloc_orders[ranking[:3]] = bloc_orders.get(ranking[:3], 0) + ballot.weight
+        else:
+            # crossover voters alternate until the shorter slate runs out
+            assert len(ranking) == 4
+            assert set(ranking[::2]) == set(slate_to_candidates["C"])
+            assert set(ranking[1::2]) <= set(slate_to_candidates["W"])
+            cross_orders[ranking[::2]] = (
+                cross_orders.get(ranking[::2], 0) + ballot.weight
+            )
+
+    assert sum(bloc_orders.values()) == 0.8 * number_of_ballots
+    assert sum(cross_orders.values()) == 0.2 * number_of_ballots
+
+    for orders, interval in [
+        (bloc_orders, pref_intervals_by_bloc["W"]["W"].interval),
+        (cross_orders, pref_intervals_by_bloc["W"]["C"].interval),
+    ]:
+        perms = list(it.permutations(interval.keys()))
+        observed = [float(orders.get(perm, 0)) for perm in perms]
+        expected = [compute_pl_prob(perm, interval) * sum(observed) for perm in perms]
+        assert stats.chisquare(observed, expected).pvalue > 0.001
+
+
 def compute_pl_prob(perm, interval):
     pref_interval = interval.copy()
     prob = 1
@@ -677,6 +743,7 @@ def test_Cambridge_distribution():
         bloc_voter_prop=bloc_voter_prop,
         cohesion_parameters=cohesion_parameters,
         path=path,
+        seed=SEED,
     )
 
     candidates = ["W1", "W2", "C1", "C2"]
@@ -902,6 +969,7 @@ def test_name_Cumulative_distribution():
         bloc_voter_prop={"W": 1},
         num_votes=2,
         cohesion_parameters={"W": {"W": 1}},
+        seed=SEED,
     )
 
     pp = cumu.generate_profile(number_of_ballots=100)
@@ -934,6 +1002,7 @@ def test_slate_BT_distribution():
                 "B": PreferenceInterval({"Z": 1}),
             },
         },
+        seed=SEED,
     )
 
     pp = sbt.generate_profile(number_of_ballots=100)
@@ -957,3 +1026,45 @@ def test_slate_BT_distribution():
 
     # Test
     assert do_ballot_probs_match_ballot_dist(ballot_prob_dict, pp)
+
+
+def test_ic_shortcut_uniform_positions():
+    number_of_ballots = 8000
+    candidates = [f"C{i}" for i in range(8)]
+
+    generated_profile = ImpartialCulture(
+        candidates=candidates, seed=3
+    ).generate_profile(number_of_ballots=number_of_ballots)
+
+    # every candidate should be equally likely to appear in every position
+    position_counts = np.zeros((len(candidates), len(candidates)))
+    for ballot in generated_profile.ballots:
+        for position, s in enumerate(ballot.ranking):
+            position_counts[candidates.index(next(iter(s))), position] += float(
+                ballot.weight
+            )
+
+    assert generated_profile.num_ballots() == number_of_ballots
+    for position in range(len(candidates)):
+        assert stats.chisquare(position_counts[:, position]).pvalue > 0.001
+
+
+def test_ballot_simplex_urn_distinct_ballots():
+    number_of_ballots = 200
+    alpha = 1e-4
+    candidates = [f"C{i}" for i in range(8)]
+
+    # sampling from a Dirichlet(alpha) draw over all n! rankings gives, in expectation,
+    # sum_i a / (a + i) distinct ballots where a = alpha * n!
+    total_alpha = alpha * math.factorial(len(candidates))
+    expected_distinct = sum(
+        total_alpha / (total_alpha + i) for i in range(number_of_ballots)
+    )
+
+    generator = BallotSimplex.from_alpha(alpha=alpha, candidates=candidates, seed=5)
+    distinct = [
+        len(generator.generate_profile(number_of_ballots=number_of_ballots).ballots)
+        for _ in range(100)
+    ]
+
+    assert abs(np.mean(distinct) - expected_distinct) < 0.1 * expected_distinct
@@ -1,6 +1,9 @@
+from fractions import Fraction
 import numpy as np
 
+from votekit.ballot import Ballot
 from votekit.ballot_generator import (
+    BallotGenerator,
     ImpartialAnonymousCulture,
     ImpartialCulture,
     name_PlackettLuce,
@@ -16,19 +19,19 @@ from votekit.ballot_generator import (
 from votekit.pref_profile import PreferenceProfile
 from votekit.pref_interval import PreferenceInterval
 
-# set seed for more consistent tests
-np.random.seed(8675309)
+# seed the generators for more consistent tests
+SEED = 8675309
 
 
 def test_IC_completion():
-    ic = ImpartialCulture(candidates=["W1", "W2", "C1", "C2"])
+    ic = ImpartialCulture(candidates=["W1", "W2", "C1", "C2"], seed=SEED)
     profile = ic.generate_profile(number_of_ballots=100)
     assert type(profile) is PreferenceProfile
     assert profile.num_ballots() == 100
 
 
 def test_IAC_completion():
-    iac = ImpartialAnonymousCulture(candidates=["W1", "W2", "C1", "C2"])
+    iac = ImpartialAnonymousCulture(candidates=["W1", "W2", "C1", "C2"], seed=SEED)
     profile = iac.generate_profile(number_of_ballots=100)
     assert type(profile) is PreferenceProfile
     assert profile.num_ballots() == 100
@@ -49,6 +52,7 @@ def test_NPL_completion():
         },
         bloc_voter_prop={"W": 0.7, "C": 0.3},
         cohesion_parameters={"W": {"W": 0.7, "C": 0.3}, "C": {"C": 0.9, "W": 0.1}},
+        seed=SEED,
     )
     profile = pl.generate_profile(number_of_ballots=100)
     assert type(profile) is PreferenceProfile
@@ -78,6 +82,7 @@ def test_name_Cumulative_completion():
         bloc_voter_prop={"W": 0.7, "C": 0.3},
         num_votes=3,
         cohesion_parameters={"W": {"W": 0.7, "C": 0.3}, "C": {"C": 0.9, "W": 0.1}},
+        seed=SEED,
     )
     profile = cumu.generate_profile(number_of_ballots=100)
     assert type(profile) is PreferenceProfile
@@ -106,6 +111,7 @@ def test_NBT_completion():
         },
         bloc_voter_prop={"W": 0.7, "C": 0.3},
         cohesion_parameters={"W": {"W": 0.7, "C": 0.3}, "C": {"C": 0.9, "W": 0.1}},
+        seed=SEED,
     )
     profile = bt.generate_profile(number_of_ballots=100)
     assert type(profile) is PreferenceProfile
@@ -135,6 +141,7 @@ def test_SPL_completion():
         },
         bloc_voter_prop={"W": 0.7, "C": 0.3},
         cohesion_parameters={"W": {"W": 0.7, "C": 0.3}, "C": {"C": 0.9, "W": 0.1}},
+        seed=SEED,
     )
     profile = sp.generate_profile(number_of_ballots=100)
     assert type(profile) is PreferenceProfile
@@ -167,6 +174,7 @@ def test_SPL_completion_zero_cand():
         },
         bloc_voter_prop={"W": 0.7, "C": 0.3},
         cohesion_parameters={"W": {"W": 0.7, "C": 0.3}, "C": {"C": 0.9, "W": 0.1}},
+        seed=SEED,
     )
     profile = sp.generate_profile(number_of_ballots=100)
     assert type(profile) is PreferenceProfile
@@ -196,6 +204,7 @@ def test_SBT_completion():
         },
         bloc_voter_prop={"W": 0.7, "C": 0.3},
         cohesion_parameters={"W": {"W": 0.7, "C": 0.3}, "C": {"C": 0.9, "W": 0.1}},
+        seed=SEED,
     )
     profile = sbt.generate_profile(number_of_ballots=100)
     assert type(profile) is PreferenceProfile
@@ -225,6 +234,7 @@ def test_AC_completion():
         },
         bloc_voter_prop={"W": 0.7, "C": 0.3},
         cohesion_parameters={"W": {"W": 0.7, "C": 0.3}, "C": {"C": 0.9, "W": 0.1}},
+        seed=SEED,
     )
     profile = ac.generate_profile(number_of_ballots=100)
     assert type(profile) is PreferenceProfile
@@ -232,7 +242,7 @@ def test_AC_completion():
 
 
 def test_1D_completion():
-    ods = OneDimSpatial(candidates=["W1", "W2", "C1", "C2"])
+    ods = OneDimSpatial(candidates=["W1", "W2", "C1", "C2"], seed=SEED)
     profile = ods.generate_profile(number_of_ballots=100)
     assert type(profile) is PreferenceProfile
     assert profile.num_ballots() == 100
@@ -254,6 +264,7 @@ def test_Cambridge_completion():
         },
         bloc_voter_prop={"A": 0.7, "B": 0.3},
         cohesion_parameters={"A": {"A": 0.7, "B": 0.3}, "B": {"B": 0.9, "A": 0.1}},
+        seed=SEED,
     )
     profile = cs.generate_profile(number_of_ballots=100)
     assert type(profile) is PreferenceProfile
@@ -272,7 +283,7 @@ def test_ballot_simplex_from_point():
     pt = {"W1": 1 / 4, "W2": 1 / 4, "C1": 1 / 4, "C2": 1 / 4}
 
     generated_profile = BallotSimplex.from_point(
-        point=pt, candidates=candidates
+        point=pt, candidates=candidates, seed=SEED
     ).generate_profile(number_of_ballots=10)
     # Test
     assert isinstance(generated_profile, PreferenceProfile)
@@ -284,6 +295,34 @@ def test_ballot_simplex_from_alpha():
     candidates = ["W1", "W2", "C1", "C2"]
 
     generated_profile = BallotSimplex.from_alpha(
-        alpha=0, candidates=candidates
+        alpha=0, candidates=candidates, seed=SEED
     ).generate_profile(number_of_ballots=number_of_ballots)
     assert generated_profile.num_ballots() == 100
+
+
+def test_ballot_pool_to_profile_array():
+    candidates = ["A", "B", "C", "D"]
+    pool = np.array([[0, 1, 2, 3], [2, 0, -1, -1], [0, 1, 2, 3], [2, 0, -1, -1]])
+
+    array_profile = BallotGenerator.ballot_pool_to_profile(pool, candidates)
+    tuple_profile = BallotGenerator.ballot_pool_to_profile(
+        [("A", "B", "C", "D"), ("C", "A"), ("A", "B", "C", "D"), ("C", "A")],
+        candidates,
+    )
+    assert array_profile == tuple_profile
+    assert array_profile.num_ballots() == 4
+
+
+def test_ballot_pool_to_profile_tied():
+    candidates = ["A", "B", "C", "D"]
+    # the last two entries of each row are tied, so their order does not matter
+    pool = np.array([[0, 1, 2, 3], [0, 1, 3, 2], [3, 2, 1, 0]])
+
+    profile = BallotGenerator.ballot_pool_to_profile(pool, candidates, num_tied=2)
+    target = PreferenceProfile(
+        ballots=[
+            Ballot(ranking=({"A"}, {"B"}, {"C", "D"}), weight=Fraction(2)),
+            Ballot(ranking=({"D"}, {"C"}, {"A", "B"}), weight=Fraction(1)),
+        ]
+    )
+    assert profile == target
@@ -221,3 +221,23 @@ def test_interval_sum_from_params():
             ):
                 assert False
     assert True
+
+
+def test_seed_from_params():
+    blocs = {"R": 0.6, "D": 0.4}
+    cohesion = {"R": {"R": 0.7, "D": 0.3}, "D": {"D": 0.6, "R": 0.4}}
+    alphas = {"R": {"R": 0.5, "D": 1}, "D": {"R": 1, "D": 0.5}}
+    slate_to_cands = {"R": ["A1", "B1", "C1"], "D": ["A2", "B2"]}
+
+    profiles = []
+    for _ in range(2):
+        sbt = slate_BradleyTerry.from_params(
+            bloc_voter_prop=blocs,
+            slate_to_candidates=slate_to_cands,
+            cohesion_parameters=cohesion,
+            alphas=alphas,
+            seed=12,
+        )
+        profiles.append(sbt.generate_profile(100))
+
+    assert profiles[0] == profiles[1]
@@ -1,5 +1,6 @@
 from fractions import Fraction
 from pathlib import Path
+import random
 import pytest
 
 from votekit.ballot import Ballot
@@ -164,6 +165,33 @@ def test_rand_transfer_assert():
     assert 400 < counts[0].votes < 600
 
 
+def test_rand_transfer_seeded_totals():
+    winner = "A"
+    ballots = [
+        Ballot(ranking=({"A"}, {"C"}, {"B"}), weight=Fraction(30)),
+        Ballot(ranking=({"A"}, {"B"}, {"C"}), weight=Fraction(20)),
+        Ballot(ranking=({"A"}, {"D"}), weight=Fraction(10)),
+        Ballot(ranking=({"B"}, {"C"}), weight=Fraction(7)),
+    ]
+    votes = {"A": 60}
+    threshold = 35
+
+    random.seed(4)
+    ballots_after_transfer = random_transfer(
+        winner=winner, ballots=ballots, votes=votes, threshold=threshold
+    )
+    random.seed(4)
+    repeated = random_transfer(
+        winner=winner, ballots=ballots, votes=votes, threshold=threshold
+    )
+
+    transferred = {b.ranking: b.weight for b in ballots_after_transfer[1:]}
+    assert sum(transferred.values()) == votes[winner] - threshold
+    assert all(transferred.get(b.ranking[1:], 0) <= b.weight for b in ballots[:3])
+    assert ballots_after_transfer[0].weight == Fraction(7)
+    assert ballots_after_transfer == repeated
+
+
 def test_toy_rcv():
     """
     example toy election taken from David McCune's code with known winners c and d
@@ -4,6 +4,7 @@ from votekit.cvr_loaders import load_csv
 from votekit.election_state import ElectionState
 import votekit.elections.election_types as et
 from votekit.pref_profile import PreferenceProfile
+from votekit.utils import compute_scores_from_vector
 
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -160,3 +161,31 @@ def test_borda_three_winner():
     compare_io_borda(
         profile=TEST_PROFILE_B, seats=3, score_vector=None, target_state=borda_target1
     )
+
+
+def test_borda_keeps_score_vector_as_passed():
+    election = et.Borda(profile=TEST_PROFILE_B, seats=3, tiebreak="none")
+    outcome = election.run_election()
+
+    assert election.score_vector is None
+    assert outcome.elected == [{"A", "B"}, {"C"}]
+
+
+def test_highest_score_stores_scores():
+    election = et.HighestScore(
+        profile=TEST_PROFILE_B, seats=2, score_vector=[3, 2, 1], tiebreak="none"
+    )
+    outcome = election.run_election()
+    target_scores = compute_scores_from_vector(TEST_PROFILE_B, [3, 2, 1])
+
+    assert outcome.get_scores(outcome.curr_round) == target_scores
+
+
+def test_dom_set_rerun_after_reset():
+    election = et.DominatingSets(profile=TEST_PROFILE_C)
+    first = election.run_to_step(1)
+    election.reset()
+    second = election.run_to_step(1)
+
+    equal_electionstates(first, second)
+    assert first.scores == second.scores
@@ -1,6 +1,6 @@
 from fractions import Fraction
 
-from votekit.models import fix_ties, recursively_fix_ties
+from votekit.models import fix_ties
 from votekit.ballot import Ballot
 from votekit.pref_profile import PreferenceProfile
 from votekit.elections.election_types import STV
@@ -34,8 +34,7 @@ def test_tie_for_last():
 
 def test_multiple_ties():
     tied = Ballot(ranking=[{"A"}, {"B", "D"}, {"C", "E"}], weight=Fraction(4))
-    part = fix_ties(tied)
-    complete = recursively_fix_ties(part, 2)
+    complete = fix_ties(tied)
 
     assert len(complete) == 4
     assert (
@@ -46,8 +45,7 @@ def test_multiple_ties():
 
 def test_all_ties():
     tied = Ballot(ranking=[{"A", "F"}, {"B", "D"}, {"C", "E"}], weight=Fraction(4))
-    part = fix_ties(tied)
-    complete = recursively_fix_ties(part, 3)
+    complete = fix_ties(tied)
 
     assert len(complete) == 8
     assert (
@@ -128,3 +128,44 @@ def test_add_profiles():
     )
 
     assert profile_1 + profile_2 == summed_profile
+
+
+def test_max_ballot_length():
+    profile = PreferenceProfile(
+        ballots=[
+            Ballot(ranking=[{"A"}, {"B"}, {"C"}], weight=Fraction(1)),
+            Ballot(ranking=[{"B"}], weight=Fraction(1)),
+        ]
+    )
+    copy = PreferenceProfile(ballots=profile.get_ballots())
+    assert profile.max_ballot_length() == 3
+    assert profile == copy
+    assert PreferenceProfile().max_ballot_length() == 0
+
+
+def test_rank_matrix():
+    profile = PreferenceProfile(
+        ballots=[
+            Ballot(ranking=[{"A", "B"}, {"C"}], weight=Fraction(1)),
+            Ballot(ranking=[{"C"}], weight=Fraction(2)),
+        ]
+    )
+    matrix, cands = profile.rank_matrix()
+    ranks = [{c: int(r) for c, r in zip(cands, row)} for row in matrix]
+
+    assert ranks == [{"A": 0, "B": 0, "C": 1}, {"A": -1, "B": -1, "C": 0}]
+
+    repeated = PreferenceProfile(ballots=[Ballot(ranking=[{"A"}, {"B"}, {"A"}])])
+    assert repeated.rank_matrix() is None
+
+
+def test_reassigned_ballots_clear_cache():
+    profile = PreferenceProfile(
+        ballots=[Ballot(ranking=[{"A"}, {"B"}, {"C"}], weight=Fraction(1))]
+    )
+    assert profile.max_ballot_length() == 3
+    assert profile.rank_matrix() is not None
+
+    profile.ballots = [Ballot(ranking=[{"A"}, {"B"}, {"A"}, {"C"}])]
+    assert profile.max_ballot_length() == 4
+    assert profile.rank_matrix() is None
@@ -111,3 +111,14 @@ def test_graph_build():
 
     edge_match = iso.numerical_edge_match("weight", 1)
     assert nx.is_isomorphic(pwcg_graph, target_graph, edge_match=edge_match)
+
+
+def test_h2h_matrix_matches_count():
+    pwcg = PairwiseComparisonGraph(TEST_PROFILE)
+    counts, denom = pwcg.head2head_matrix()
+
+    for i, cand_a in enumerate(pwcg.candidates):
+        for j, cand_b in enumerate(pwcg.candidates):
+            if i != j:
+                target = pwcg.head2head_count(cand_a, cand_b)
+                assert Fraction(int(counts[i, j]), denom) == target
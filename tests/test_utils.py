@@ -1,4 +1,5 @@
 from fractions import Fraction
+import numpy as np
 
 from votekit.ballot import Ballot
 from votekit.pref_profile import PreferenceProfile
@@ -7,6 +8,7 @@ from votekit.utils import (
     first_place_votes,
     borda_scores,
     scores_into_set_list,
+    tie_broken_ranking,
 )
 
 
@@ -105,6 +107,56 @@ def test_borda_short_ballot():
     assert method_borda_dict == target_borda_dict
 
 
+def test_borda_with_ties():
+    profile = PreferenceProfile(
+        ballots=[
+            Ballot(ranking=[{"A"}, {"B", "C"}], weight=Fraction(1)),
+            Ballot(ranking=[{"B"}], weight=Fraction(2)),
+        ]
+    )
+    target_borda_dict = {
+        "A": Fraction(3),
+        "B": Fraction(9, 2),
+        "C": Fraction(3, 2),
+    }
+
+    assert borda_scores(profile) == target_borda_dict
+
+
+def test_borda_float_score_vector():
+    profile = PreferenceProfile(
+        ballots=[
+            Ballot(ranking=[{"A"}, {"B", "C"}, {"D"}], weight=Fraction(1)),
+            Ballot(ranking=[{"A"}, {"B"}, {"C"}, {"D"}], weight=Fraction(1, 3)),
+        ]
+    )
+    score_vector = [1.5, 0.7, 0.2, 0.1]
+
+    # whole number floats score exactly like the integer vector
+    assert borda_scores(profile, score_vector=np.array([4.0, 3.0, 2.0, 1.0])) == (
+        borda_scores(profile, score_vector=[4, 3, 2, 1])
+    )
+
+    # untied positions score their entry exactly, tied ones the mean of their entries
+    tied_share = (Fraction(0.7) + Fraction(0.2)) / 2
+    assert borda_scores(profile, score_vector=score_vector) == {
+        "A": Fraction(1.5) * Fraction(4, 3),
+        "B": tied_share + Fraction(0.7) / 3,
+        "C": tied_share + Fraction(0.2) / 3,
+        "D": Fraction(0.1) * Fraction(4, 3),
+    }
+
+    # whole number weights take the vectorized path, which scores the same way
+    assert borda_scores(
+        PreferenceProfile(ballots=profile.ballots[:1]), score_vector=score_vector
+    ) == {
+        "A": Fraction(1.5),
+        "B": tied_share,
+        "C": tied_share,
+        "D": Fraction(0.1),
+    }
+
+
 # def test_candidate_position_dict():
 #     assert True
 
@@ -134,3 +186,17 @@ def test_scores_into_set_list():
 
 # def test_elect_cands_from_set_ranking():
 #     assert True
+
+
+def test_tiebreak_precomputed_scores():
+    ranking = [{"B", "C"}]
+    computed = tie_broken_ranking(ranking, profile, tiebreak="borda")
+    precomputed = tie_broken_ranking(
+        ranking, profile, tiebreak="borda", tiebreak_scores=borda_scores(profile)
+    )
+    given = tie_broken_ranking(
+        ranking, profile, tiebreak="borda", tiebreak_scores={"B": 2, "C": 1}
+    )
+
+    assert computed == precomputed == [{"C"}, {"B"}]
+    assert given == [{"B"}, {"C"}]